@@ -0,0 +1,175 @@
+import sys
+from collections import namedtuple
+
+# Column role bit flags (a column can hold several roles at once)
+TIME = 1
+METRIC = 2
+LABEL = 4
+CATEGORICAL = 8
+
+ROLE_NAMES = {TIME: "time", METRIC: "metric", LABEL: "label", CATEGORICAL: "categorical"}
+
+
+# Declared foreign key: Table.column -> ref_table.ref_column (ref_column may be None = ref table's PK)
+ForeignKey = namedtuple("ForeignKey", ["column", "ref_table", "ref_column"])
+
+# One physical table of a time-sharded family, covering epoch seconds [start, end)
+Shard = namedtuple("Shard", ["name", "start", "end"])
+
+
+def normalize_table_name(name):
+    # Detection/lookup key: [dbo].[Orders] and "Orders" both become Orders
+    return name.replace('[', '').replace(']', '').replace('"', '').replace('`', '')
+
+
+class Column:
+    # Slotted + interned strings: ~100k columns stay a few MB instead of one pydantic model each
+    __slots__ = ("name", "data_type", "flags", "unit", "table")
+
+    def __init__(self, name, data_type, flags=0, unit="short", table=None):
+        self.name = name
+        self.data_type = sys.intern(data_type)
+        self.flags = flags
+        self.unit = sys.intern(unit)
+        self.table = table
+
+    @property
+    def is_time_col(self):
+        return bool(self.flags & TIME)
+
+    @property
+    def is_metric(self):
+        return bool(self.flags & METRIC)
+
+    @property
+    def is_label(self):
+        return bool(self.flags & LABEL)
+
+    @property
+    def is_categorical(self):
+        return bool(self.flags & CATEGORICAL)
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "data_type": self.data_type,
+            "is_time_col": self.is_time_col,
+            "is_metric": self.is_metric,
+            "is_label": self.is_label,
+            "is_categorical": self.is_categorical,
+            "unit": self.unit,
+        }
+
+    def __repr__(self):
+        roles = "|".join(label for flag, label in ROLE_NAMES.items() if self.flags & flag) or "-"
+        return f"Column({self.name!r}, {self.data_type!r}, {roles}, unit={self.unit!r})"
+
+
+class Table:
+    __slots__ = ("name", "key", "columns", "primary_key", "foreign_keys", "shards",
+                 "time_columns", "metrics", "labels", "categoricals", "_by_name")
+
+    def __init__(self, name, columns, primary_key=(), foreign_keys=(), shards=()):
+        self.name = name
+        self.key = normalize_table_name(name)
+        self.columns = tuple(columns)
+        self.primary_key = tuple(primary_key)
+        self.foreign_keys = tuple(foreign_keys)
+        # Empty for ordinary tables; a logical table collapsed from period shards lists them oldest first
+        self.shards = tuple(shards)
+
+        # Role indexes, built once so the generator never re-filters column lists
+        self.time_columns = tuple(c for c in self.columns if c.flags & TIME)
+        self.metrics = tuple(c for c in self.columns if c.flags & METRIC)
+        self.labels = tuple(c for c in self.columns if c.flags & LABEL)
+        self.categoricals = tuple(c for c in self.columns if c.flags & CATEGORICAL)
+        self._by_name = {}
+        for col in self.columns:
+            col.table = self
+            self._by_name.setdefault(normalize_table_name(col.name).lower(), col)
+
+    @property
+    def time_col(self):
+        # Primary time column (heuristic: first one found)
+        return self.time_columns[0] if self.time_columns else None
+
+    def column(self, name):
+        return self._by_name.get(normalize_table_name(name).lower())
+
+    def is_primary_key(self, column_name):
+        return len(self.primary_key) == 1 and self.primary_key[0].lower() == column_name.lower()
+
+    def columns_with(self, roles):
+        return [c for c in self.columns if c.flags & roles]
+
+    # Legacy dict-style access (table['name'], table['columns']) for older callers
+    def __getitem__(self, key):
+        if key == "name":
+            return self.name
+        if key == "columns":
+            return list(self.columns)
+        raise KeyError(key)
+
+    def to_dict(self):
+        result = {"name": self.name, "columns": [c.to_dict() for c in self.columns]}
+        if self.shards:
+            result["shards"] = [shard.name for shard in self.shards]
+        return result
+
+    def __repr__(self):
+        if self.shards:
+            return f"Table({self.name!r}, {len(self.columns)} columns, {len(self.shards)} shards)"
+        return f"Table({self.name!r}, {len(self.columns)} columns)"
+
+
+class SchemaCatalog:
+    def __init__(self, tables=()):
+        self.tables = []
+        self._by_key = {}
+        self._by_column = {}
+        self._by_role = {flag: [] for flag in ROLE_NAMES}
+        for table in tables:
+            self.add(table)
+
+    def add(self, table):
+        self.tables.append(table)
+        self._by_key.setdefault(table.key.lower(), table)
+        for col in table.columns:
+            self._by_column.setdefault(normalize_table_name(col.name).lower(), []).append(col)
+            for flag, bucket in self._by_role.items():
+                if col.flags & flag:
+                    bucket.append(col)
+        return table
+
+    # --- O(1) lookups ---
+    def table(self, name):
+        return self._by_key.get(normalize_table_name(name).lower())
+
+    def __contains__(self, name):
+        return self.table(name) is not None
+
+    @property
+    def table_names(self):
+        return [t.key for t in self.tables]
+
+    def columns_named(self, name):
+        return self._by_column.get(normalize_table_name(name).lower(), [])
+
+    def columns_with_role(self, flag):
+        return self._by_role[flag]
+
+    # --- Sequence behaviour (keeps `for table in catalog` / `if not catalog` working) ---
+    def __iter__(self):
+        return iter(self.tables)
+
+    def __len__(self):
+        return len(self.tables)
+
+    def __getitem__(self, index):
+        return self.tables[index]
+
+    def to_dict(self):
+        return {"tables": [t.to_dict() for t in self.tables]}
+
+    def __repr__(self):
+        return f"SchemaCatalog({len(self.tables)} tables)"
@@ -0,0 +1,197 @@
+import re
+
+# Plain identifiers never need quoting; anything else (spaces, dashes, ...) does
+SIMPLE_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def normalize_identifier(name):
+    # Strip the quoting styles DDL dumps use: [Name], "Name", `Name`
+    return name.strip().strip('[]"`')
+
+
+def is_quoted_identifier(name):
+    # The parser keeps the DDL's own spelling, so quoting there tells how the engine stored it
+    name = name.strip()
+    return len(name) > 1 and name[0] in '["`'
+
+
+def sql_literal(text):
+    return "'" + text.replace("'", "''") + "'"
+
+
+def format_interval(seconds):
+    # Grafana interval shorthand: 3600 -> '1h', 86400 -> '1d'
+    for suffix, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds % size == 0:
+            return f"{seconds // size}{suffix}"
+    return f"{seconds}s"
+
+
+class SQLiteDialect:
+    name = "sqlite"
+    label = "SQLite"
+    datasource_type = "frser-sqlite-datasource"
+
+    # SQLite accepts the DDL's own spelling ([Name] included), so keep it untouched
+    def identifier(self, name):
+        return name
+
+    # schema.relation: each part is quoted on its own ("analytics"."Hourly", not "analytics.Hourly")
+    def qualified_identifier(self, name):
+        return ".".join(self.identifier(part) for part in name.split("."))
+
+    def time_filter(self, column):
+        return f"unixepoch({column}) BETWEEN $__from/1000 AND $__to/1000"
+
+    def time_group(self, column, seconds):
+        return f"(unixepoch({column})/{seconds})*{seconds}"
+
+    # Constant predicate on the dashboard range alone: SQLite evaluates it once, before the
+    # loop, so a shard outside [start, end) is never opened
+    def shard_guard(self, start, end):
+        return f"$__to/1000 >= {start} AND $__from/1000 < {end}"
+
+    def datasource(self):
+        return {"type": self.datasource_type, "uid": "${datasource}"}
+
+    def target(self, sql_query, time_series=False, time_columns=True):
+        target = {
+            "datasource": self.datasource(),
+            "format": "table",
+            "queryText": sql_query,
+            "rawQueryText": sql_query,
+            "rawSql": sql_query,
+            "refId": "A",
+        }
+        if time_columns:
+            target["timeColumns"] = ["time", "ts"]
+        return target
+
+    # Hook for engines that pre-aggregate (Timescale continuous aggregates)
+    def trend_source(self, table_name, metric, seconds):
+        return None
+
+    # Approximate row count without a full scan. sqlite_stat1 only exists after ANALYZE and a
+    # missing table fails the whole query, so read the rowid b-tree's last key instead
+    # (exact until rows are deleted).
+    def row_estimate(self, table_name):
+        return f"SELECT MAX(rowid) as value FROM {self.identifier(table_name)}"
+
+
+class PostgresDialect(SQLiteDialect):
+    name = "postgres"
+    label = "PostgreSQL"
+    datasource_type = "grafana-postgresql-datasource"
+
+    # Postgres folds unquoted names to lower case, both in the DDL and in our queries, so a name
+    # keeps the DDL's quoting: CREATE TABLE OnlineTransactions is queried bare (as
+    # onlinetransactions), CREATE TABLE "OnlineTransactions" quoted
+    def identifier(self, name):
+        quoted = is_quoted_identifier(name)
+        name = normalize_identifier(name)
+        if SIMPLE_IDENTIFIER.match(name) and (not quoted or name == name.lower()):
+            return name
+        return '"' + name.replace('"', '""') + '"'
+
+    # Grafana macros expand to sargable predicates, so indexes and chunk pruning apply
+    def time_filter(self, column):
+        return f"$__timeFilter({column})"
+
+    def time_group(self, column, seconds):
+        return f"$__timeGroup({column}, '{format_interval(seconds)}')"
+
+    # The macros expand to numeric literals, so the planner folds the guard and drops the branch
+    def shard_guard(self, start, end):
+        return f"$__unixEpochTo() >= {start} AND $__unixEpochFrom() < {end}"
+
+    # Planner statistics, refreshed by (auto)vacuum/ANALYZE; -1 means never analyzed.
+    # regclass input folds case like SQL does, so the literal reuses identifier()'s quoting.
+    def row_estimate(self, table_name):
+        return (
+            f"SELECT GREATEST(reltuples, 0)::bigint as value FROM pg_class "
+            f"WHERE oid = {sql_literal(self.identifier(table_name))}::regclass"
+        )
+
+    def target(self, sql_query, time_series=False, time_columns=True):
+        return {
+            "datasource": self.datasource(),
+            "editorMode": "code",
+            "format": "time_series" if time_series else "table",
+            "rawQuery": True,
+            "rawSql": sql_query,
+            "refId": "A",
+        }
+
+
+class MySQLDialect(PostgresDialect):
+    name = "mysql"
+    label = "MySQL"
+    datasource_type = "mysql"
+
+    def identifier(self, name):
+        name = normalize_identifier(name)
+        if SIMPLE_IDENTIFIER.match(name):
+            return name
+        return "`" + name.replace("`", "``") + "`"
+
+    # InnoDB's sampled estimate (can be off by 40-50% on busy tables)
+    def row_estimate(self, table_name):
+        return (
+            f"SELECT TABLE_ROWS as value FROM information_schema.TABLES "
+            f"WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = {sql_literal(normalize_identifier(table_name))}"
+        )
+
+
+class TimescaleDialect(PostgresDialect):
+    name = "timescaledb"
+    label = "TimescaleDB"
+
+    def __init__(self, continuous_aggregates=None):
+        # table name -> continuous aggregate view, either "view_name" or
+        # {"view": "view_name", "time_column": "bucket"}
+        self.continuous_aggregates = {
+            normalize_identifier(table): agg for table, agg in (continuous_aggregates or {}).items()
+        }
+
+    def time_group(self, column, seconds):
+        return f"time_bucket('{seconds} seconds', {column})"
+
+    # Sums per-chunk statistics on hypertables, falls back to reltuples on plain tables
+    def row_estimate(self, table_name):
+        return f"SELECT approximate_row_count({sql_literal(self.identifier(table_name))}::regclass) as value"
+
+    def trend_source(self, table_name, metric, seconds):
+        agg = self.continuous_aggregates.get(normalize_identifier(table_name))
+        if agg is None:
+            return None
+        if isinstance(agg, str):
+            agg = {"view": agg}
+        bucket = self.identifier(agg.get("time_column", "bucket"))
+        # Roll the pre-aggregated buckets up to the panel's step instead of scanning the hypertable
+        return (
+            f"SELECT {self.time_group(bucket, seconds)} as time, "
+            f"SUM({metric}) as value "
+            f"FROM {self.qualified_identifier(agg['view'])} "
+            f"WHERE {self.time_filter(bucket)} "
+            f"GROUP BY 1 ORDER BY 1"
+        )
+
+
+DIALECTS = {
+    dialect.name: dialect
+    for dialect in (SQLiteDialect, PostgresDialect, MySQLDialect, TimescaleDialect)
+}
+
+
+def get_dialect(dialect="sqlite", continuous_aggregates=None):
+    if not isinstance(dialect, str):
+        return dialect
+    try:
+        dialect_cls = DIALECTS[dialect.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown SQL dialect '{dialect}'. Choose one of: {', '.join(DIALECTS)}")
+    if dialect_cls is TimescaleDialect:
+        return dialect_cls(continuous_aggregates)
+    if continuous_aggregates:
+        raise ValueError("Continuous aggregates are only supported by the timescaledb dialect.")
+    return dialect_cls()
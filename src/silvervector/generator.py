@@ -0,0 +1,325 @@
+import json
+import os
+
+# Try importing from package, fallback to local if running script directly
+try:
+    from silvervector.dialects import SQLiteDialect, get_dialect
+    from silvervector.tracing import NULL_TRACER
+    from silvervector.joins import build_join_graph, dimension_columns
+    from silvervector.packs import default_registry
+    from silvervector.policy import apply_query_policies
+except ImportError:
+    from dialects import SQLiteDialect, get_dialect
+    from tracing import NULL_TRACER
+    from joins import build_join_graph, dimension_columns
+    from packs import default_registry
+    from policy import apply_query_policies
+
+# Locate the template file relative to this script
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates", "base_dashboard.json")
+
+# How "Total Records"-style stats count rows:
+#   exact:    count(*) over the whole table (full scan every refresh)
+#   estimate: engine statistics / rowid, titled "(estimated)"
+#   window:   count(*) over the dashboard range via the time column (estimate if there is none)
+ROW_COUNT_MODES = ("exact", "estimate", "window")
+
+
+class DashboardGenerator:
+    def __init__(self, tables, dialect="sqlite", continuous_aggregates=None, tracer=None,
+                 suggest_joins=False, max_join_panels=4, packs=None,
+                 query_policies=True, sample_db=None, row_counts="exact"):
+        self.tables = tables
+        self.packs = default_registry() if packs is None else packs
+        self.dialect = get_dialect(dialect, continuous_aggregates)
+        self.tracer = tracer or NULL_TRACER
+        self.suggest_joins = suggest_joins
+        self.max_join_panels = max_join_panels
+        self.query_policies = query_policies
+        self.sample_db = sample_db
+        if sample_db and self.dialect.name != "sqlite":
+            raise ValueError("Profiling a sample database is only supported for the sqlite dialect.")
+        if row_counts not in ROW_COUNT_MODES:
+            raise ValueError(f"Unknown row count mode '{row_counts}'. Choose one of: {', '.join(ROW_COUNT_MODES)}")
+        self.row_counts = row_counts
+        self.panel_meta = {}
+        self.stat_panels = []
+        self.graph_panels = []
+        self.panel_id_counter = 1
+        self.x_pos = 0
+        self.y_pos = 4
+
+    def generate(self):
+        with self.tracer.span("load template", "template"):
+            with open(TEMPLATE_PATH, 'r') as f:
+                dashboard = json.load(f)
+
+        # --- Application Panel Packs (Orchard Core, WordPress, ...) ---
+        with self.tracer.span("match packs", "packs"):
+            matched_packs = self.packs.match(self.tables) if self.packs else []
+        for pack in matched_packs:
+            with self.tracer.span(f"panels {pack.name}", "panels"):
+                pack.contribute(self)
+
+        # --- Generic Panel Generation ---
+        for table in self.tables:
+            with self.tracer.span(f"panels {table.name}", "panels"):
+                self._add_table_panels(table)
+
+        # --- Cross-Table Panels (Auto-Join Suggestions) ---
+        if self.suggest_joins:
+            with self.tracer.span("join suggestions", "joins"):
+                self._add_join_panels()
+
+        # Point the datasource picker at the target engine's plugin
+        for variable in dashboard["templating"]["list"]:
+            if variable["name"] == "datasource":
+                variable["query"] = self.dialect.datasource_type
+
+        dashboard["panels"] = self.stat_panels + self.graph_panels
+        dashboard["title"] = "SilverVector Generated Dashboard"
+        dashboard["refresh"] = "10s" # Adds auto-refresh
+
+        # Per-panel cache/maxDataPoints/interval, and the cheapest safe dashboard refresh
+        if self.query_policies:
+            with self.tracer.span("query policies", "policy", profiled=bool(self.sample_db)):
+                dashboard["refresh"] = apply_query_policies(dashboard["panels"], self.panel_meta, self.sample_db)
+        dashboard["time"] = {"from": "now-30d", "to": "now"} # Default view
+        return dashboard
+
+    # Grid Layout Logic: hands out the next id/position (2 panels per 24-column row)
+    def _layout(self):
+        panel_id, x_pos, y_pos = self.panel_id_counter, self.x_pos, self.y_pos
+        self.panel_id_counter += 1
+        self.x_pos += 12
+        if self.x_pos >= 24:
+            self.x_pos = 0
+            self.y_pos += 8
+        return panel_id, x_pos, y_pos
+
+    # --- Panel API (used by the generic passes and by packs) ---
+    # `kind` drives the caching policy (see policy.py); extra meta such as
+    # bucket_seconds or growth_sources=((table, time_column), ...) refines it.
+    def add_time_series_panel(self, title, sql_query, unit="short", kind="trend", **meta):
+        panel = create_time_series_panel(title, sql_query, *self._layout(), unit, self.dialect)
+        self._track(self.graph_panels, panel, kind, meta)
+
+    def add_stat_panel(self, title, sql_query, unit="short", kind="total", **meta):
+        panel = create_stat_panel(title, sql_query, *self._layout(), unit, self.dialect)
+        self._track(self.stat_panels, panel, kind, meta)
+
+    def add_pie_chart_panel(self, title, sql_query, kind="distribution", **meta):
+        panel = create_pie_chart_panel(title, sql_query, *self._layout(), self.dialect)
+        self._track(self.graph_panels, panel, kind, meta)
+
+    def add_table_panel(self, title, sql_query, kind="recent", **meta):
+        panel = create_table_panel(title, sql_query, *self._layout(), self.dialect)
+        self._track(self.graph_panels, panel, kind, meta)
+
+    # FROM clause for a table. A logical table collapsed from period shards becomes a UNION ALL
+    # of its shards; with ranged=True each branch is guarded so only the shards overlapping the
+    # dashboard range are read (use it for queries that filter on the time column anyway).
+    def table_source(self, table, ranged=False, alias=None):
+        d = self.dialect
+        if not table.shards:
+            return f"{d.identifier(table.name)} {alias}" if alias else d.identifier(table.name)
+        columns = ", ".join(d.identifier(col.name) for col in table.columns)
+        branches = []
+        for shard in table.shards:
+            branch = f"SELECT {columns} FROM {d.identifier(shard.name)}"
+            if ranged:
+                branch += f" WHERE {d.shard_guard(shard.start, shard.end)}"
+            branches.append(branch)
+        return f"({' UNION ALL '.join(branches)}) AS {alias or d.identifier(table.name)}"
+
+    def _row_estimate(self, table):
+        if not table.shards:
+            return self.dialect.row_estimate(table.name)
+        estimates = " UNION ALL ".join(self.dialect.row_estimate(shard.name) for shard in table.shards)
+        return f"SELECT SUM(value) as value FROM ({estimates}) AS shards"
+
+    # Whole-table row count stat, honouring the row_counts mode
+    def add_row_count_stat(self, title, table, **meta):
+        d = self.dialect
+        time_col = table.time_col
+        if self.row_counts == "window" and time_col is not None:
+            count_sql = (
+                f"SELECT count(*) as value FROM {self.table_source(table, ranged=True)} "
+                f"WHERE {d.time_filter(d.identifier(time_col.name))}"
+            )
+            self.add_stat_panel(f"{title} (in range)", count_sql, "short", kind="window_stat", **meta)
+        elif self.row_counts != "exact":
+            self.add_stat_panel(f"{title} (estimated)", self._row_estimate(table), "short", kind="estimate", **meta)
+        else:
+            self.add_stat_panel(title, f"SELECT count(*) as value FROM {self.table_source(table)}", "short", **meta)
+
+    def _track(self, panels, panel, kind, meta):
+        panels.append(panel)
+        self.panel_meta[panel["id"]] = dict(meta, kind=kind)
+
+    def _add_table_panels(self, table):
+        d = self.dialect
+        table_name = table.name
+        source = self.table_source(table)
+        ranged_source = self.table_source(table, ranged=True)
+
+        # Primary time column (heuristic: first one found)
+        time_col = table.time_col
+        if not time_col:
+            return # Skip tables without time dimension for now
+        time_ref = d.identifier(time_col.name)
+        growth = ((source, time_ref),)
+
+        # Create a panel for each metric
+        for metric in table.metrics:
+            metric_ref = d.identifier(metric.name)
+
+            # --- 1. The Financial "Executive" Stat (ONLY for MYR) ---
+            is_money = "myr" in metric.name.lower()
+            unit = "currencyMYR" if is_money else "short"
+
+            if is_money:
+                stat_sql = (
+                    f"SELECT SUM({metric_ref}) as value FROM {ranged_source} "
+                    f"WHERE {d.time_filter(time_ref)}"
+                )
+                self.add_stat_panel(f"Total Revenue ({metric.name})", stat_sql, unit,
+                                    kind="window_stat", growth_sources=growth)
+
+            # --- 2. The Detailed Trend Graph (FOR ALL METRICS) ---
+            sql_query = d.trend_source(table_name, metric_ref, 3600) or (
+                f"SELECT {d.time_group(time_ref, 3600)} as time, "
+                f"SUM({metric_ref}) as value "
+                f"FROM {ranged_source} "
+                f"WHERE {d.time_filter(time_ref)} "
+                f"GROUP BY 1 ORDER BY 1"
+            )
+            self.add_time_series_panel(f"{table_name} - {metric.name} Trend", sql_query, unit,
+                                       bucket_seconds=3600, growth_sources=growth)
+
+        # --- 3. Total Records Stat ---
+        self.add_row_count_stat(f"{table_name} - Total Records", table, growth_sources=growth)
+
+        # --- 4. Categorical Pie Charts ---
+        for cat_col in table.categoricals:
+            pie_sql = (
+                f"SELECT {d.identifier(cat_col.name)}, count(*) as value "
+                f"FROM {source} "
+                f"GROUP BY 1 ORDER BY 2 DESC"
+            )
+            self.add_pie_chart_panel(f"{table_name} - {cat_col.name} Distribution", pie_sql, growth_sources=growth)
+
+    def _add_join_panels(self):
+        d = self.dialect
+        added = 0
+
+        # Cheapest joins first (declared FKs before name guesses)
+        for edge in build_join_graph(self.tables):
+            time_col = edge.fact.time_col
+            if not time_col or not edge.fact.metrics:
+                continue
+            on_clause = f"f.{d.identifier(edge.fact_column)} = dim.{d.identifier(edge.dimension_column)}"
+
+            for dim_col in dimension_columns(edge.dimension):
+                for metric in edge.fact.metrics:
+                    if added >= self.max_join_panels:
+                        return
+                    join_sql = (
+                        f"SELECT dim.{d.identifier(dim_col.name)}, SUM(f.{d.identifier(metric.name)}) as value "
+                        f"FROM {self.table_source(edge.fact, ranged=True, alias='f')} "
+                        f"JOIN {self.table_source(edge.dimension, alias='dim')} ON {on_clause} "
+                        f"WHERE {d.time_filter('f.' + d.identifier(time_col.name))} "
+                        f"GROUP BY 1 ORDER BY 2 DESC"
+                    )
+                    self.add_pie_chart_panel(f"{edge.fact.name} - {metric.name} by {dim_col.name}", join_sql,
+                                             growth_sources=((self.table_source(edge.fact), d.identifier(time_col.name)),))
+                    added += 1
+
+
+# Helper for generating panel JSON
+def create_time_series_panel(title, sql_query, panel_id, x_pos, y_pos, unit, dialect=None):
+    dialect = dialect or SQLiteDialect()
+    return {
+        "title": title,
+        "type": "timeseries",
+        "id": panel_id,
+        "gridPos": {"h": 8, "w": 12, "x": x_pos, "y": y_pos},
+        "datasource": dialect.datasource(),
+        "targets": [dialect.target(sql_query, time_series=True)],
+        "fieldConfig": {
+            "defaults": {
+                "custom": {
+                    "drawStyle": "line",
+                    "lineInterpolation": "smooth",
+                    "spanNulls": False
+                },
+                "unit": unit
+            }
+        }
+    }
+
+# Helper for generating stat panel JSON
+def create_stat_panel(title, sql_query, panel_id, x_pos, y_pos, unit="short", dialect=None):
+    dialect = dialect or SQLiteDialect()
+    return {
+        "title": title,
+        "type": "stat",
+        "id": panel_id,
+        "gridPos": {"h": 8, "w": 12, "x": x_pos, "y": y_pos}, # Shorter and narrower
+        "datasource": dialect.datasource(),
+        "targets": [dialect.target(sql_query)],
+        "options": {
+            "graphMode": "area", # Adds a small sparkline under the number
+            "colorMode": "background", # Colors the whole box
+            "justifyMode": "center"
+        },
+        "fieldConfig": {
+            "defaults": {
+                "unit": unit,
+                "thresholds": {
+                    "mode": "absolute",
+                    "steps": [
+                        {"color": "green", "value": None}
+                    ]
+                }
+            }
+        }
+    }
+
+# Helper for generating pie chart panel JSON
+def create_pie_chart_panel(title, sql_query, panel_id, x_pos, y_pos, dialect=None):
+    dialect = dialect or SQLiteDialect()
+    return {
+        "title": title,
+        "type": "piechart",
+        "id": panel_id,
+        "gridPos": {"h": 8, "w": 12, "x": x_pos, "y": y_pos},
+        "datasource": dialect.datasource(),
+        "targets": [dialect.target(sql_query, time_columns=False)],
+        "options": {
+            "legend": {"displayMode": "list", "placement": "right"},
+            "pieType": "donut",
+            "reduceOptions": {"values": True, "calcs": ["lastNotNull"], "fields": ""}
+        }
+    }
+
+# Helper for generating table panel JSON
+def create_table_panel(title, sql_query, panel_id, x_pos, y_pos, dialect=None):
+    dialect = dialect or SQLiteDialect()
+    return {
+        "title": title,
+        "type": "table",
+        "id": panel_id,
+        "gridPos": {"h": 8, "w": 12, "x": x_pos, "y": y_pos},
+        "datasource": dialect.datasource(),
+        "targets": [dialect.target(sql_query, time_columns=False)],
+        "fieldConfig": {
+            "defaults": {
+                "custom": {
+                    "align": "auto",
+                    "displayMode": "auto",
+                    "inspect": False
+                }
+            }
+        }
+    }
@@ -0,0 +1,127 @@
+import re
+
+# Try importing from package, fallback to local if running script directly
+try:
+    from silvervector.catalog import normalize_table_name
+except ImportError:
+    from catalog import normalize_table_name
+
+# Base cost per kind of evidence: a declared FK is a sure thing, a name match is a guess
+COST_FOREIGN_KEY = 1.0
+COST_SHARED_KEY = 2.0
+COST_NAME_STEM = 2.5
+# A key name owned by more tables than this is too ambiguous to guess a join from
+MAX_SHARED_KEY_OWNERS = 3
+# Wider dimension tables cost more to read per joined row
+COST_PER_DIMENSION_COLUMN = 0.01
+
+# Label columns that are (almost) unique per row make useless GROUP BY dimensions
+HIGH_CARDINALITY_HINTS = ("name", "email", "phone", "address", "url", "message", "description", "title", "comment", "token", "hash")
+
+# Matched against the column's original case: snake_case "<stem>_id" or camelCase "<stem>Id".
+# A bare "id" ending is not enough (valid, paid, void, grid).
+ID_SUFFIX = re.compile(r"^(?P<stem>[A-Za-z0-9_]+?)(?:_[iI][dD]|(?<=[a-z0-9])Id)$")
+
+
+class JoinEdge:
+    __slots__ = ("fact", "fact_column", "dimension", "dimension_column", "source", "cost")
+
+    def __init__(self, fact, fact_column, dimension, dimension_column, source, cost):
+        self.fact = fact
+        self.fact_column = fact_column
+        self.dimension = dimension
+        self.dimension_column = dimension_column
+        self.source = source
+        self.cost = cost
+
+    def describe(self):
+        return f"{self.fact.name}.{self.fact_column} → {self.dimension.name}.{self.dimension_column}"
+
+    def __repr__(self):
+        return f"JoinEdge({self.describe()}, {self.source}, cost={self.cost:.2f})"
+
+
+class JoinGraph:
+    def __init__(self, edges):
+        self.edges = sorted(edges, key=lambda e: (e.cost, e.fact.key, e.dimension.key))
+        self._by_table = {}
+        for edge in self.edges:
+            self._by_table.setdefault(edge.fact.key.lower(), []).append(edge)
+            self._by_table.setdefault(edge.dimension.key.lower(), []).append(edge)
+
+    def neighbors(self, table_name):
+        return self._by_table.get(normalize_table_name(table_name).lower(), [])
+
+    def __iter__(self):
+        return iter(self.edges)
+
+    def __len__(self):
+        return len(self.edges)
+
+
+def build_join_graph(catalog):
+    edges = []
+    seen = set()
+
+    def add_edge(fact, fact_column, dimension, dimension_column, source, base_cost):
+        key = (fact.key.lower(), fact_column.lower(), dimension.key.lower())
+        if fact is dimension or key in seen:
+            return
+        seen.add(key)
+        cost = base_cost + COST_PER_DIMENSION_COLUMN * len(dimension.columns)
+        edges.append(JoinEdge(fact, fact_column, dimension, dimension_column, source, cost))
+
+    # 1. Declared foreign keys (e.g. OnlineTransactions.customer_id -> RegisteredCustomers)
+    for table in catalog:
+        for fk in table.foreign_keys:
+            dimension = catalog.table(fk.ref_table)
+            if dimension is None:
+                continue
+            ref_column = fk.ref_column or (dimension.primary_key[0] if len(dimension.primary_key) == 1 else fk.column)
+            add_edge(table, fk.column, dimension, ref_column, "foreign_key", COST_FOREIGN_KEY)
+
+    # 2. Inverted indexes, built in one pass so matching never compares table pairs:
+    #    single-column PK name -> owning tables, and table-name stem -> table
+    pk_owners = {}
+    stems = {}
+    for table in catalog:
+        if len(table.primary_key) == 1:
+            pk_owners.setdefault(table.primary_key[0].lower(), []).append(table)
+        stem = table.key.rsplit('.', 1)[-1].lower()
+        stems.setdefault(stem, table)
+        for suffix in ("es", "s"):
+            if stem.endswith(suffix):
+                stems.setdefault(stem[:-len(suffix)], table)
+
+    for table in catalog:
+        for col in table.columns:
+            name = col.name.lower()
+            if name == "id" or table.is_primary_key(name):
+                continue
+
+            # Shared key: plain column here, single-column PK elsewhere (customer_id -> Customers)
+            owners = pk_owners.get(name, ())
+            if len(owners) <= MAX_SHARED_KEY_OWNERS:
+                for dimension in owners:
+                    add_edge(table, col.name, dimension, dimension.primary_key[0], "shared_key", COST_SHARED_KEY)
+
+            # 3. <table>_id pointing at a table whose PK is plain "id" (user_id -> users.id)
+            match = ID_SUFFIX.match(normalize_table_name(col.name))
+            if match:
+                dimension = stems.get(match.group("stem").lower().rstrip("_"))
+                if dimension is not None and dimension.is_primary_key("id"):
+                    add_edge(table, col.name, dimension, dimension.primary_key[0], "name_stem", COST_NAME_STEM)
+
+    return JoinGraph(edges)
+
+
+def dimension_columns(table):
+    # Categoricals first, then low-cardinality text labels (region, country, ...)
+    dims = list(table.categoricals)
+    for col in table.labels:
+        name = col.name.lower()
+        if col in dims or "id" in name or any(hint in name for hint in HIGH_CARDINALITY_HINTS):
+            continue
+        if "char" in col.data_type or "text" in col.data_type:
+            dims.append(col)
+    return dims
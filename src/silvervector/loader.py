@@ -0,0 +1,165 @@
+import gzip
+import mmap
+import os
+import re
+
+# Files above this size (or any gzip) are scanned for DDL instead of loaded verbatim
+LARGE_FILE_BYTES = 5 * 1024 * 1024
+GZIP_CHUNK_BYTES = 8 * 1024 * 1024
+PROGRESS_STEP_BYTES = 4 * 1024 * 1024
+
+# Statement heads we care about (schema) or must skip quickly (data)
+STATEMENT_START = re.compile(
+    rb"^[ \t]*(?:"
+    rb"(?P<create>CREATE\s+(?:(?:GLOBAL|LOCAL)\s+)?(?:(?:TEMP|TEMPORARY|UNLOGGED)\s+)?TABLE)"
+    rb"|(?P<alter>ALTER\s+TABLE)"
+    rb"|(?P<copy>COPY)"
+    rb"|(?P<insert>INSERT)"
+    rb")\b",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# String literals: standard SQL only doubles quotes ('it''s'); mysqldump also backslash-escapes
+# them ('it\'s'), which would otherwise flip quote parity and swallow every later statement
+SQL_STRING = rb"'[^']*+'"
+MYSQL_STRING = rb"'(?:[^'\\]++|\\[\s\S])*+'"
+MYSQL_DUMP_HEADER = re.compile(rb"\A(?:\s*+--[^\n]*\n)*?\s*+-- (?:MySQL|MariaDB) dump\b")
+HEADER_BYTES = 4096
+
+
+def statement_end(string):
+    # Up to and including the terminating ';', skipping quoted strings and -- comments.
+    # Possessive quantifiers keep this linear on huge INSERT values.
+    return re.compile(rb"(?:[^';\-]++|" + string + rb"|--[^\n]*+|-)*+;")
+
+
+def insert_run(string):
+    # A whole run of consecutive INSERT statements in one C-level match (sqlite3 .dump writes one per row)
+    return re.compile(rb"(?:[ \t]*INSERT\b(?:[^';]++|" + string + rb")*+;\s*+)++", re.IGNORECASE)
+
+
+STATEMENT_END = statement_end(SQL_STRING)
+INSERT_RUN = insert_run(SQL_STRING)
+MYSQL_STATEMENT_END = statement_end(MYSQL_STRING)
+MYSQL_INSERT_RUN = insert_run(MYSQL_STRING)
+
+COPY_FROM_STDIN = re.compile(rb"\bFROM\s+stdin\b", re.IGNORECASE)
+COPY_DATA_END = re.compile(rb"^\\\.\r?$", re.MULTILINE)
+
+
+class SchemaScanner:
+    def __init__(self, backslash_escapes=False):
+        self.statements = []
+        self.in_copy_data = False
+        self.statement_end = MYSQL_STATEMENT_END if backslash_escapes else STATEMENT_END
+        self.insert_run = MYSQL_INSERT_RUN if backslash_escapes else INSERT_RUN
+
+    # Scans buf (bytes or mmap), returns how many bytes were fully consumed.
+    # With final=False, an incomplete trailing statement is left for the next call.
+    def scan(self, buf, final=True, on_advance=None):
+        pos = 0
+        end_of_buf = len(buf)
+
+        while pos < end_of_buf:
+            if on_advance:
+                on_advance(pos)
+            if self.in_copy_data:
+                done = COPY_DATA_END.search(buf, pos)
+                if done is None:
+                    if final:
+                        return end_of_buf
+                    # Keep the partial last line: it may be the terminator
+                    return max(pos, buf.rfind(b"\n", pos) + 1)
+                self.in_copy_data = False
+                pos = done.end()
+                continue
+
+            head = STATEMENT_START.search(buf, pos)
+            if head is None:
+                if final:
+                    return end_of_buf
+                return max(pos, buf.rfind(b"\n", pos) + 1)
+
+            if head.group("insert"):
+                run = self.insert_run.match(buf, head.start())
+                if run is not None and run.end() > head.start():
+                    pos = run.end()
+                    continue
+
+            tail = self.statement_end.match(buf, head.start())
+            if tail is None:
+                if not final:
+                    return head.start()
+                stmt_end = end_of_buf
+            else:
+                stmt_end = tail.end()
+
+            if head.group("create"):
+                self.statements.append(bytes(buf[head.start():stmt_end]))
+            elif head.group("alter"):
+                stmt = bytes(buf[head.start():stmt_end])
+                # Only foreign keys matter to SilverVector (pg_dump adds them via ALTER TABLE)
+                if b"FOREIGN KEY" in stmt.upper():
+                    self.statements.append(stmt)
+            elif head.group("copy") and COPY_FROM_STDIN.search(buf, head.start(), stmt_end):
+                self.in_copy_data = True
+
+            pos = stmt_end
+
+        return pos
+
+
+def is_gzip(path):
+    with open(path, 'rb') as f:
+        return f.read(2) == b"\x1f\x8b"
+
+
+def is_mysql_dump(path):
+    # mysqldump / mariadb-dump open with a "-- MySQL dump 10.13 ..." comment block
+    opener = gzip.open if is_gzip(path) else open
+    with opener(path, 'rb') as f:
+        return MYSQL_DUMP_HEADER.match(f.read(HEADER_BYTES)) is not None
+
+
+def should_extract(path):
+    return is_gzip(path) or os.path.getsize(path) > LARGE_FILE_BYTES
+
+
+def iter_schema_statements(path, progress=None):
+    total = os.path.getsize(path)
+    scanner = SchemaScanner(backslash_escapes=bool(total) and is_mysql_dump(path))
+    reported = 0
+
+    def report(done):
+        nonlocal reported
+        if progress and done - reported >= PROGRESS_STEP_BYTES:
+            reported = done
+            progress(done, total)
+
+    if is_gzip(path):
+        # Can't mmap compressed data: stream it, progress is measured on the compressed bytes
+        with open(path, 'rb') as raw, gzip.GzipFile(fileobj=raw) as f:
+            pending = b""
+            while True:
+                chunk = f.read(GZIP_CHUNK_BYTES)
+                final = not chunk
+                buf = pending + chunk
+                consumed = scanner.scan(buf, final=final)
+                pending = buf[consumed:]
+                yield from (s.decode("utf-8", errors="replace") for s in scanner.statements)
+                scanner.statements.clear()
+                report(raw.tell())
+                if final:
+                    break
+    elif total:
+        # The OS pages the dump in lazily; the regexes jump straight over data sections
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            scanner.scan(mm, final=True, on_advance=report)
+        yield from (s.decode("utf-8", errors="replace") for s in scanner.statements)
+
+    if progress:
+        progress(total, total)
+
+
+def extract_ddl(path, progress=None):
+    return "\n\n".join(iter_schema_statements(path, progress))
@@ -8,8 +8,20 @@ import json
 # Try importing from package, fallback to local if running script directly
 try:
     from silvervector.parser import SilverVectorParser
+    from silvervector.generator import DashboardGenerator
+    from silvervector.dialects import DIALECTS
+    from silvervector.tracing import Tracer
+    from silvervector.catalog import METRIC, TIME
+    from silvervector.joins import build_join_graph
+    from silvervector.loader import extract_ddl, should_extract
 except ImportError:
     from parser import SilverVectorParser
+    from generator import DashboardGenerator
+    from dialects import DIALECTS
+    from tracing import Tracer
+    from catalog import METRIC, TIME
+    from joins import build_join_graph
+    from loader import extract_ddl, should_extract
 
 # Initialize the UI Theme
 ctk.set_appearance_mode("Dark")
@@ -66,6 +78,36 @@ class SilverVectorApp(ctk.CTk):
                                         command=self.generate_grafana_json)
         self.generate_btn.pack(side="left", padx=5, pady=5)
 
+        # Target SQL Dialect (drives datasource plugin + time macros)
+        self.dialect_labels = {cls.label: name for name, cls in DIALECTS.items()}
+        self.dialect_menu = ctk.CTkOptionMenu(self.toolbar, values=list(self.dialect_labels), width=130)
+        self.dialect_menu.set("SQLite")
+        self.dialect_menu.pack(side="left", padx=5, pady=5)
+
+        # Row counts: exact count(*), engine estimates, or count over the dashboard range
+        self.count_labels = {"Exact Counts": "exact", "Estimated Counts": "estimate", "Counts in Range": "window"}
+        self.count_menu = ctk.CTkOptionMenu(self.toolbar, values=list(self.count_labels), width=140)
+        self.count_menu.set("Exact Counts")
+        self.count_menu.pack(side="left", padx=5, pady=5)
+
+        # Auto-Join: add cross-table panels from FKs / matching key names
+        self.join_switch = ctk.CTkSwitch(self.toolbar, text="Auto-Join", font=ctk.CTkFont(size=12))
+        self.join_switch.pack(side="left", padx=5, pady=5)
+
+        # Sample DB (Unicode File Cabinet) - profile query cost/table growth for cache policies
+        self.sample_db_btn = ctk.CTkButton(self.toolbar, text="\U0001F5C4", width=btn_size, height=btn_size,
+                                        fg_color="transparent", hover_color="#404040",
+                                        command=self.select_sample_db)
+        self.sample_db_btn.pack(side="left", padx=5, pady=5)
+        self.sample_db = None
+
+        # Export Trace (Unicode Stopwatch) - timings of the last generation
+        self.trace_btn = ctk.CTkButton(self.toolbar, text="\u23F1", width=btn_size, height=btn_size,
+                                    fg_color="transparent", hover_color="#404040",
+                                    command=self.export_trace)
+        self.trace_btn.pack(side="left", padx=5, pady=5)
+        self.last_trace = None
+
         # --- 2. Main Editor Area ---
         # We use a frame to give it some nice padding from the edges
         self.editor_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
@@ -194,16 +236,37 @@ class SilverVectorApp(ctk.CTk):
             start_index = end_index
 
     def load_file(self):
-        file_path = filedialog.askopenfilename(filetypes=[("SQL Files", "*.sql"), ("Text Files", "*.txt")])
+        file_path = filedialog.askopenfilename(filetypes=[("SQL Files", "*.sql"), ("Text Files", "*.txt"),
+                                                          ("Database Dumps", "*.sql *.dump *.gz")])
         if file_path:
-            with open(file_path, 'r') as f:
-                content = f.read()
+            if should_extract(file_path):
+                # Large/gzipped dumps: only the CREATE TABLE (and FK) statements matter
+                content = self.extract_dump(file_path)
+            else:
+                with open(file_path, 'r') as f:
+                    content = f.read()
             
             self.text_area.delete("1.0", "end")
             self.text_area.insert("1.0", content)
             self.highlight_sql()
             self.set_status(f"Loaded file: {os.path.basename(file_path)}")
 
+    def extract_dump(self, file_path):
+        self.progress_bar.configure(mode="determinate")
+        self.progress_bar.set(0)
+        self.progress_bar.pack(side="left", padx=10, fill="x", expand=True) # Show
+
+        def on_progress(done, total):
+            self.progress_bar.set(done / total if total else 1)
+            self.status_label.configure(text=f"Scanning dump: {done / 1048576:,.0f} / {total / 1048576:,.0f} MB")
+            self.update_idletasks()
+
+        try:
+            return extract_ddl(file_path, progress=on_progress)
+        finally:
+            self.progress_bar.pack_forget() # Hide
+            self.progress_bar.configure(mode="indeterminate")
+
     def analyze_ddl(self):
         sql_input = self.text_area.get("1.0", "end").strip()
         if not sql_input:
@@ -221,10 +284,10 @@ class SilverVectorApp(ctk.CTk):
                     widget.destroy()
 
                 for table in tables:
-                    table_name = table['name']
+                    table_name = table.name
                     
                     # Filter for relevant columns first
-                    relevant_cols = [c for c in table['columns'] if c.is_metric or c.is_time_col]
+                    relevant_cols = table.columns_with(METRIC | TIME)
                     
                     # If no relevant columns, skip this table entirely
                     if not relevant_cols:
@@ -251,6 +314,17 @@ class SilverVectorApp(ctk.CTk):
                         badge = ctk.CTkLabel(col_frame, text=icon, width=20)
                         badge.pack(side="right")
 
+                # Join Suggestions (cheapest first)
+                join_graph = build_join_graph(tables)
+                if len(join_graph):
+                    heading = ctk.CTkLabel(self.preview_scroll, text="\U0001F517 Join Suggestions",
+                                         font=ctk.CTkFont(size=13, weight="bold"), anchor="w")
+                    heading.pack(fill="x", pady=(10, 5))
+                    for edge in join_graph:
+                        label = ctk.CTkLabel(self.preview_scroll, text=f"{edge.describe()}  ({edge.source})",
+                                           font=ctk.CTkFont(size=12), anchor="w")
+                        label.pack(fill="x", padx=10)
+
                 self.set_status("Analysis completed. Config updated.")
             else:
                 self.set_status("Error: Could not find a valid CREATE TABLE statement.", is_error=True)
@@ -268,9 +342,12 @@ class SilverVectorApp(ctk.CTk):
         self.progress_bar.start()
         self.update_idletasks() # Force UI update often
 
+        tracer = Tracer()
+        self.last_trace = tracer
+
         try:
             # 1. Parse Data
-            parser = SilverVectorParser(sql_input)
+            parser = SilverVectorParser(sql_input, tracer=tracer)
             tables = parser.parse()
             
             if not tables:
@@ -279,185 +356,15 @@ class SilverVectorApp(ctk.CTk):
                 self.set_status("Error: No valid tables found.", is_error=True)
                 return
 
-            # 2. Load Template
-            # Locate the template file relative to this script
-            base_path = os.path.dirname(os.path.abspath(__file__))
-            template_path = os.path.join(base_path, "templates", "base_dashboard.json")
-            
-            with open(template_path, 'r') as f:
-                dashboard = json.load(f)
-
-            # 3. Generate Panels
-            stat_panels = []
-            graph_panels = []
-            panel_id_counter = 1
-            x_pos = 0
-            y_pos = 4
-
-            # --- Orchard Core Specific Detection & Panels ---
-            # Normalize table names (remove brackets) for detection
-            table_names = [t['name'].replace('[', '').replace(']', '') for t in tables]
-            is_orchard = "ContentItemIndex" in table_names
-
-            if is_orchard:
-                # 1. Content Velocity (Graph)
-                # Daily publishing rate
-                vel_sql = (
-                    "SELECT (unixepoch(PublishedUtc)/86400)*86400 as time, count(*) as value "
-                    "FROM ContentItemIndex WHERE Published = 1 "
-                    "AND unixepoch(PublishedUtc) BETWEEN $__from/1000 AND $__to/1000 "
-                    "GROUP BY 1 ORDER BY 1"
-                )
-                graph_panels.append(self.create_time_series_panel(
-                    "Content Velocity (Items/Day)", vel_sql, panel_id_counter, x_pos, y_pos, "short"
-                ))
-                panel_id_counter += 1
-                x_pos += 12
-                if x_pos >= 24: x_pos = 0; y_pos += 8
-
-                # 2. Content Types (Pie)
-                type_sql = "SELECT ContentType, count(*) as value FROM ContentItemIndex WHERE Published = 1 GROUP BY 1 ORDER BY 2 DESC"
-                graph_panels.append(self.create_pie_chart_panel(
-                    "Content Type Distribution", type_sql, panel_id_counter, x_pos, y_pos
-                ))
-                panel_id_counter += 1
-                x_pos += 12
-                if x_pos >= 24: x_pos = 0; y_pos += 8
-                
-                # 3. Recent Activity (Table)
-                # Last 10 modifications
-                activity_sql = (
-                    "SELECT ModifiedUtc, DisplayText, Author, ContentType "
-                    "FROM ContentItemIndex "
-                    "ORDER BY ModifiedUtc DESC LIMIT 10"
-                )
-                graph_panels.append(self.create_table_panel(
-                    "Recent Content Activity", activity_sql, panel_id_counter, x_pos, y_pos
-                ))
-                panel_id_counter += 1
-                x_pos += 12
-                if x_pos >= 24: x_pos = 0; y_pos += 8
-                
-                # 4. Total Users (Stat) - if UserIndex exists
-                if "UserIndex" in table_names:
-                    user_sql = "SELECT count(*) as value FROM UserIndex"
-                    stat_panels.append(self.create_stat_panel(
-                        "Total Users", user_sql, panel_id_counter, x_pos, y_pos, "short"
-                    ))
-                    panel_id_counter += 1
-                    x_pos += 12
-                    if x_pos >= 24: x_pos = 0; y_pos += 8
-
-            # --- Generic Panel Generation ---
-            for table in tables:
-                table_name = table['name']
-                t_cols = table['columns']
-
-                # Find the primary time column (heuristic: first one found)
-                time_col = next((c for c in t_cols if c.is_time_col), None)
-                if not time_col:
-                    continue # Skip tables without time dimension for now
-                
-                # Create a panel for each metric
-                metrics = [c for c in t_cols if c.is_metric]
-                for metric in metrics:
-                    # --- 1. The Financial "Executive" Stat (ONLY for MYR) ---
-                    is_money = "myr" in metric.name.lower()
-                    unit = "currencyMYR" if is_money else "short"
-                    
-                    if is_money:
-                        stat_sql = (
-                            f"SELECT SUM({metric.name}) as value FROM {table_name} "
-                            f"WHERE unixepoch(created_at) BETWEEN $__from/1000 AND $__to/1000"
-                        )
-                        stat = self.create_stat_panel(
-                            title=f"Total Revenue ({metric.name})",
-                            sql_query=stat_sql,
-                            panel_id=panel_id_counter,
-                            x_pos=x_pos, 
-                            y_pos=y_pos,
-                            unit=unit
-                        )
-                        stat_panels.append(stat)
-                        panel_id_counter += 1
-
-                        x_pos += 12
-                        if x_pos >= 24:
-                            x_pos = 0
-                            y_pos += 8
-
-                    # --- 2. The Detailed Trend Graph (FOR ALL METRICS) ---
-                    sql_query = (
-                        f"SELECT (unixepoch({time_col.name})/3600)*3600 as time, "
-                        f"SUM({metric.name}) as value "
-                        f"FROM {table_name} "
-                        f"WHERE unixepoch({time_col.name}) BETWEEN $__from/1000 AND $__to/1000 "
-                        f"GROUP BY 1 ORDER BY 1"
-                    )
-
-                    graph = self.create_time_series_panel(
-                        title=f"{table_name} - {metric.name} Trend",
-                        sql_query=sql_query,
-                        panel_id=panel_id_counter,
-                        x_pos=x_pos,
-                        y_pos=y_pos,
-                        unit=unit
-                    )
-                    graph_panels.append(graph)
-                    panel_id_counter += 1
-
-                    # --- 3. Grid Layout Logic for Graphs ---
-                    x_pos += 12
-                    if x_pos >= 24:
-                        x_pos = 0
-                        y_pos += 8
-
-                # --- 4. Total Records Stat ---
-                count_sql = f"SELECT count(*) as value FROM {table_name}"
-                count_stat = self.create_stat_panel(
-                    title=f"{table_name} - Total Records",
-                    sql_query=count_sql,
-                    panel_id=panel_id_counter,
-                    x_pos=x_pos,
-                    y_pos=y_pos,
-                    unit="short"
-                )
-                stat_panels.append(count_stat)
-                panel_id_counter += 1
-                
-                x_pos += 12
-                if x_pos >= 24:
-                    x_pos = 0
-                    y_pos += 8
-
-                # --- 5. Categorical Pie Charts ---
-                categorical_cols = [c for c in t_cols if c.is_categorical]
-                for cat_col in categorical_cols:
-                    pie_sql = (
-                        f"SELECT {cat_col.name}, count(*) as value "
-                        f"FROM {table_name} "
-                        f"GROUP BY 1 ORDER BY 2 DESC"
-                    )
-                    pie = self.create_pie_chart_panel(
-                        title=f"{table_name} - {cat_col.name} Distribution",
-                        sql_query=pie_sql,
-                        panel_id=panel_id_counter,
-                        x_pos=x_pos,
-                        y_pos=y_pos
-                    )
-                    graph_panels.append(pie)
-                    panel_id_counter += 1
-
-                    x_pos += 12
-                    if x_pos >= 24:
-                        x_pos = 0
-                        y_pos += 8
-
-            all_panels = stat_panels + graph_panels
-            dashboard["panels"] = all_panels
-            dashboard["title"] = "SilverVector Generated Dashboard"
-            dashboard["refresh"] = "10s" # Adds auto-refresh
-            dashboard["time"] = {"from": "now-30d", "to": "now"} # Default view
+            # 2. Build Dashboard (Template + Panels)
+            dialect = self.dialect_labels[self.dialect_menu.get()]
+            generator = DashboardGenerator(tables, dialect=dialect, tracer=tracer,
+                                           suggest_joins=bool(self.join_switch.get()),
+                                           row_counts=self.count_labels[self.count_menu.get()],
+                                           sample_db=self.sample_db if dialect == "sqlite" else None)
+            dashboard = generator.generate()
+            all_panels = dashboard["panels"]
+            graph_panels = generator.graph_panels
 
             self.progress_bar.stop()
             self.progress_bar.pack_forget() # Hide
@@ -466,17 +373,20 @@ class SilverVectorApp(ctk.CTk):
                 self.set_status("Warning: No panels were generated.", is_error=True)
                 return
 
-            # 4. Display JSON in Tab
-            json_str = json.dumps(dashboard, indent=2)
-            self.json_area.delete("1.0", "end")
-            self.json_area.insert("1.0", json_str)
-            self.highlight_json()
+            # 3. Display JSON in Tab
+            with tracer.span("json.dumps", "serialize"):
+                json_str = json.dumps(dashboard, indent=2)
+            with tracer.span("json_area.insert", "display"):
+                self.json_area.delete("1.0", "end")
+                self.json_area.insert("1.0", json_str)
+            with tracer.span("highlight_json", "highlight", chars=len(json_str)):
+                self.highlight_json()
             
             # Switch to JSON Tab
             self.editor_tabs.set("Generated JSON")
-            self.set_status(f"Generated {len(all_panels)} panels. JSON ready in output tab.")
+            self.set_status(f"Generated {len(all_panels)} panels. JSON ready in output tab. ({tracer.format_summary()})")
 
-            # 5. Optional Save (Ask user)
+            # 4. Optional Save (Ask user)
             if messagebox.askyesno("Save to File?", "JSON generated successfully! Do you also want to save it to a .json file?"):
                 file_path = filedialog.asksaveasfilename(
                     title="Save Grafana Dashboard",
@@ -494,6 +404,30 @@ class SilverVectorApp(ctk.CTk):
             self.progress_bar.pack_forget()
             self.set_status(f"Generation failed: {str(e)}", is_error=True)
 
+    def select_sample_db(self):
+        file_path = filedialog.askopenfilename(title="Sample SQLite Database (Cancel to clear)",
+                                               filetypes=[("SQLite Databases", "*.db *.sqlite *.sqlite3")])
+        self.sample_db = file_path or None
+        if self.sample_db:
+            self.set_status(f"Cache policies will be tuned against {os.path.basename(file_path)}")
+        else:
+            self.set_status("Sample database cleared. Cache policies use query kind only.")
+
+    def export_trace(self):
+        if not self.last_trace or not self.last_trace.events:
+            messagebox.showinfo("No Trace", "Generate a dashboard first to record its timings.")
+            return
+
+        file_path = filedialog.asksaveasfilename(
+            title="Save Chrome Trace",
+            initialfile="silvervector_trace.json",
+            defaultextension=".json",
+            filetypes=[("Trace Event JSON", "*.json")]
+        )
+        if file_path:
+            self.last_trace.export(file_path)
+            self.set_status(f"Trace saved to {os.path.basename(file_path)} (open in chrome://tracing or ui.perfetto.dev)")
+
     # Helper to update status bar
     def set_status(self, text, is_error=False):
         self.status_label.configure(text=text)
@@ -503,142 +437,6 @@ class SilverVectorApp(ctk.CTk):
             self.status_label.configure(text_color="#0085D0")
         self.update_idletasks()
 
-    # Helper for generating panel JSON
-    def create_time_series_panel(self, title, sql_query, panel_id, x_pos, y_pos, unit):
-        return {
-            "title": title,
-            "type": "timeseries",
-            "id": panel_id,
-            "gridPos": {"h": 8, "w": 12, "x": x_pos, "y": y_pos},
-            "datasource": {
-                "type": "frser-sqlite-datasource",
-                "uid": "${datasource}"
-            },
-            "targets": [
-                {
-                    "datasource": {
-                        "type": "frser-sqlite-datasource",
-                        "uid": "${datasource}"
-                    },
-                    "format": "table",
-                    "queryText": sql_query,
-                    "rawQueryText": sql_query,
-                    "rawSql": sql_query,
-                    "refId": "A",
-                    "timeColumns": ["time", "ts"]
-                }
-            ],
-            "fieldConfig": {
-                "defaults": {
-                    "custom": {
-                        "drawStyle": "line",
-                        "lineInterpolation": "smooth",
-                        "spanNulls": False
-                    },
-                    "unit": unit
-                }
-            }
-        }
-    
-    # Helper for generating stat panel JSON
-    def create_stat_panel(self, title, sql_query, panel_id, x_pos, y_pos, unit="short"):
-        return {
-            "title": title,
-            "type": "stat",
-            "id": panel_id,
-            "gridPos": {"h": 8, "w": 12, "x": x_pos, "y": y_pos}, # Shorter and narrower
-            "datasource": {
-                "type": "frser-sqlite-datasource",
-                "uid": "${datasource}"
-            },
-            "targets": [
-                {
-                    "datasource": {"type": "frser-sqlite-datasource", "uid": "${datasource}"},
-                    "format": "table",
-                    "queryText": sql_query,
-                    "rawQueryText": sql_query,
-                    "rawSql": sql_query,
-                    "refId": "A",
-                    "timeColumns": ["time", "ts"]
-                }
-            ],
-            "options": {
-                "graphMode": "area", # Adds a small sparkline under the number
-                "colorMode": "background", # Colors the whole box
-                "justifyMode": "center"
-            },
-            "fieldConfig": {
-                "defaults": {
-                    "unit": unit,
-                    "thresholds": {
-                        "mode": "absolute",
-                        "steps": [
-                            {"color": "green", "value": None}
-                        ]
-                    }
-                }
-            }
-        }
-
-    # Helper for generating pie chart panel JSON
-    def create_pie_chart_panel(self, title, sql_query, panel_id, x_pos, y_pos):
-        return {
-            "title": title,
-            "type": "piechart",
-            "id": panel_id,
-            "gridPos": {"h": 8, "w": 12, "x": x_pos, "y": y_pos},
-            "datasource": {
-                "type": "frser-sqlite-datasource",
-                "uid": "${datasource}"
-            },
-            "targets": [
-                {
-                    "datasource": {"type": "frser-sqlite-datasource", "uid": "${datasource}"},
-                    "format": "table",
-                    "queryText": sql_query,
-                    "rawQueryText": sql_query,
-                    "rawSql": sql_query,
-                    "refId": "A",
-                }
-            ],
-            "options": {
-                "legend": {"displayMode": "list", "placement": "right"},
-                "pieType": "donut",
-                "reduceOptions": {"values": True, "calcs": ["lastNotNull"], "fields": ""}
-            }
-        }
-
-    # Helper for generating table panel JSON
-    def create_table_panel(self, title, sql_query, panel_id, x_pos, y_pos):
-        return {
-            "title": title,
-            "type": "table",
-            "id": panel_id,
-            "gridPos": {"h": 8, "w": 12, "x": x_pos, "y": y_pos},
-            "datasource": {
-                "type": "frser-sqlite-datasource",
-                "uid": "${datasource}"
-            },
-            "targets": [
-                {
-                    "datasource": {"type": "frser-sqlite-datasource", "uid": "${datasource}"},
-                    "format": "table",
-                    "queryText": sql_query,
-                    "rawQueryText": sql_query,
-                    "rawSql": sql_query,
-                    "refId": "A",
-                }
-            ],
-            "fieldConfig": {
-                "defaults": {
-                    "custom": {
-                        "align": "auto",
-                        "displayMode": "auto",
-                        "inspect": False
-                    }
-                }
-            }
-        }
 if __name__ == "__main__":
     app = SilverVectorApp()
     app.mainloop()
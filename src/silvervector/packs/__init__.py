@@ -0,0 +1,34 @@
+from .base import PackRegistry, PanelPack, load_entry_point_packs
+from .orchard_core import OrchardCorePack
+from .wordpress import WordPressPack
+from .django_auth import DjangoAuthPack
+
+BUILTIN_PACKS = (OrchardCorePack, WordPressPack, DjangoAuthPack)
+
+_default_registry = None
+
+
+def default_registry():
+    # Built-ins plus anything installed under the "silvervector.packs" entry point group
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = load_entry_point_packs(PackRegistry(BUILTIN_PACKS))
+    return _default_registry
+
+
+def register_pack(pack):
+    # Usable as a class decorator for packs defined in-process
+    default_registry().register(pack)
+    return pack
+
+
+__all__ = [
+    "BUILTIN_PACKS",
+    "DjangoAuthPack",
+    "OrchardCorePack",
+    "PackRegistry",
+    "PanelPack",
+    "WordPressPack",
+    "default_registry",
+    "register_pack",
+]
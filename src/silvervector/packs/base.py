@@ -0,0 +1,91 @@
+from importlib.metadata import entry_points
+
+# Try importing from package, fallback to local if running script directly
+try:
+    from silvervector.catalog import normalize_table_name
+except ImportError:
+    from catalog import normalize_table_name
+
+ENTRY_POINT_GROUP = "silvervector.packs"
+
+
+def _key(name):
+    # Same lookup key as the catalog, case-insensitive
+    return normalize_table_name(name).lower()
+
+
+class PanelPack:
+    # Application-specific panels, switched on when the schema carries the pack's signature.
+    # `tables`: every table must exist; `columns`: {table: (column, ...)} must exist too.
+    name = "Unnamed Pack"
+    tables = ()
+    columns = {}
+
+    def signature(self):
+        tokens = {("table", _key(t)) for t in self.tables}
+        for table, cols in self.columns.items():
+            tokens.add(("table", _key(table)))
+            tokens.update(("column", _key(table), _key(c)) for c in cols)
+        return tokens
+
+    # Add panels through the generator (gen.add_*_panel) so layout and dialect stay shared
+    def contribute(self, gen):
+        raise NotImplementedError
+
+
+class PackRegistry:
+    def __init__(self, packs=()):
+        self.packs = []
+        self._sizes = []
+        self._index = {}            # signature token -> indexes of packs that need it
+        self._column_tables = set() # tables whose columns some pack inspects
+        for pack in packs:
+            self.register(pack)
+
+    def register(self, pack):
+        if isinstance(pack, type):
+            pack = pack()
+        signature = pack.signature()
+        if not signature:
+            raise ValueError(f"Pack '{pack.name}' must declare at least one table.")
+        pack_index = len(self.packs)
+        self.packs.append(pack)
+        self._sizes.append(len(signature))
+        for token in signature:
+            self._index.setdefault(token, []).append(pack_index)
+            if token[0] == "column":
+                self._column_tables.add(token[1])
+        return pack
+
+    # One pass over the schema: each table/column probes the inverted index once,
+    # a pack matches when all of its signature tokens were hit.
+    # Cost grows with the schema, not with the number of installed packs.
+    def match(self, catalog):
+        hits = {}
+        seen = set()
+        for table in catalog:
+            key = _key(table.key)
+            # The same table in several schemas (dbo.X, tenant2.X) must only count once
+            if key in seen:
+                continue
+            seen.add(key)
+            for pack_index in self._index.get(("table", key), ()):
+                hits[pack_index] = hits.get(pack_index, 0) + 1
+            if key in self._column_tables:
+                for col in table.columns:
+                    for pack_index in self._index.get(("column", key, _key(col.name)), ()):
+                        hits[pack_index] = hits.get(pack_index, 0) + 1
+        return [self.packs[i] for i in sorted(hits) if hits[i] == self._sizes[i]]
+
+    def __iter__(self):
+        return iter(self.packs)
+
+    def __len__(self):
+        return len(self.packs)
+
+
+def load_entry_point_packs(registry):
+    # Third-party / in-house packs: [project.entry-points."silvervector.packs"] my_app = "my_pkg:MyPack"
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        registry.register(entry_point.load())
+    return registry
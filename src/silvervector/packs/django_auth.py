@@ -0,0 +1,39 @@
+from .base import PanelPack
+
+
+class DjangoAuthPack(PanelPack):
+    name = "Django Auth"
+    columns = {
+        "auth_user": ("date_joined", "last_login", "is_active", "is_staff"),
+    }
+
+    def contribute(self, gen):
+        d = gen.dialect
+        users = d.identifier("auth_user")
+
+        # 1. Sign-ups (Graph)
+        signup_sql = (
+            f"SELECT {d.time_group('date_joined', 86400)} as time, count(*) as value "
+            f"FROM {users} WHERE {d.time_filter('date_joined')} "
+            f"GROUP BY 1 ORDER BY 1"
+        )
+        gen.add_time_series_panel("User Sign-ups (Per Day)", signup_sql, "short", bucket_seconds=86400)
+
+        # 2. Recently Active (Graph) - users by day of their latest login
+        login_sql = (
+            f"SELECT {d.time_group('last_login', 86400)} as time, count(*) as value "
+            f"FROM {users} WHERE {d.time_filter('last_login')} "
+            f"GROUP BY 1 ORDER BY 1"
+        )
+        gen.add_time_series_panel("Users by Last Login Day", login_sql, "short", bucket_seconds=86400)
+
+        # 3. Account State (Pie)
+        state_sql = (
+            f"SELECT CASE WHEN is_staff THEN 'staff' WHEN is_active THEN 'active' ELSE 'inactive' END as state, "
+            f"count(*) as value FROM {users} GROUP BY 1 ORDER BY 2 DESC"
+        )
+        gen.add_pie_chart_panel("Accounts by State", state_sql)
+
+        # 4. Active Users (Stat)
+        active_sql = f"SELECT count(*) as value FROM {users} WHERE is_active"
+        gen.add_stat_panel("Active Users", active_sql, "short")
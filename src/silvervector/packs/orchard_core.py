@@ -0,0 +1,47 @@
+from .base import PanelPack
+
+
+class OrchardCorePack(PanelPack):
+    name = "Orchard Core"
+    tables = ("ContentItemIndex",)
+
+    def contribute(self, gen):
+        d = gen.dialect
+        table = gen.tables.table("ContentItemIndex")
+        content_items = d.identifier(table.name)
+
+        # Spell columns the way the DDL did (YesSql quotes its mixed-case names on Postgres)
+        def col(name):
+            column = table.column(name)
+            return d.identifier(column.name if column else name)
+
+        # 1. Content Velocity (Graph)
+        # Daily publishing rate
+        vel_sql = (
+            f"SELECT {d.time_group(col('PublishedUtc'), 86400)} as time, count(*) as value "
+            f"FROM {content_items} WHERE {col('Published')} = 1 "
+            f"AND {d.time_filter(col('PublishedUtc'))} "
+            f"GROUP BY 1 ORDER BY 1"
+        )
+        gen.add_time_series_panel("Content Velocity (Items/Day)", vel_sql, "short", bucket_seconds=86400)
+
+        # 2. Content Types (Pie)
+        type_sql = (
+            f"SELECT {col('ContentType')}, count(*) as value FROM {content_items} "
+            f"WHERE {col('Published')} = 1 GROUP BY 1 ORDER BY 2 DESC"
+        )
+        gen.add_pie_chart_panel("Content Type Distribution", type_sql)
+
+        # 3. Recent Activity (Table)
+        # Last 10 modifications
+        activity_cols = ", ".join(col(c) for c in ("ModifiedUtc", "DisplayText", "Author", "ContentType"))
+        activity_sql = (
+            f"SELECT {activity_cols} "
+            f"FROM {content_items} "
+            f"ORDER BY {col('ModifiedUtc')} DESC LIMIT 10"
+        )
+        gen.add_table_panel("Recent Content Activity", activity_sql)
+
+        # 4. Total Users (Stat) - if UserIndex exists
+        if "UserIndex" in gen.tables:
+            gen.add_row_count_stat("Total Users", gen.tables.table("UserIndex"))
@@ -0,0 +1,43 @@
+from .base import PanelPack
+
+
+class WordPressPack(PanelPack):
+    name = "WordPress"
+    tables = ("wp_users",)
+    columns = {
+        "wp_posts": ("post_date", "post_status", "post_type"),
+        "wp_comments": ("comment_date", "comment_approved"),
+    }
+
+    def contribute(self, gen):
+        d = gen.dialect
+        posts = d.identifier("wp_posts")
+        comments = d.identifier("wp_comments")
+
+        # 1. Publishing Rate (Graph)
+        posts_sql = (
+            f"SELECT {d.time_group('post_date', 86400)} as time, count(*) as value "
+            f"FROM {posts} WHERE post_status = 'publish' AND post_type = 'post' "
+            f"AND {d.time_filter('post_date')} "
+            f"GROUP BY 1 ORDER BY 1"
+        )
+        gen.add_time_series_panel("Posts Published (Per Day)", posts_sql, "short", bucket_seconds=86400)
+
+        # 2. Comment Activity (Graph)
+        comments_sql = (
+            f"SELECT {d.time_group('comment_date', 86400)} as time, count(*) as value "
+            f"FROM {comments} WHERE comment_approved = '1' "
+            f"AND {d.time_filter('comment_date')} "
+            f"GROUP BY 1 ORDER BY 1"
+        )
+        gen.add_time_series_panel("Approved Comments (Per Day)", comments_sql, "short", bucket_seconds=86400)
+
+        # 3. Content Mix (Pie)
+        type_sql = (
+            f"SELECT post_type, count(*) as value FROM {posts} "
+            f"WHERE post_status = 'publish' GROUP BY 1 ORDER BY 2 DESC"
+        )
+        gen.add_pie_chart_panel("Published Content by Type", type_sql)
+
+        # 4. Registered Users (Stat)
+        gen.add_row_count_stat("Registered Users", gen.tables.table("wp_users"))
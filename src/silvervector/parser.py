@@ -1,7 +1,21 @@
+import re
 from simple_ddl_parser import DDLParser
+from simple_ddl_parser import tokens as ddl_tokens
+from simple_ddl_parser.utils import normalize_name
 from pydantic import BaseModel
 from typing import List, Optional
 
+# Try importing from package, fallback to local if running script directly
+try:
+    from silvervector.tracing import NULL_TRACER
+    from silvervector.catalog import Column, ForeignKey, Table, SchemaCatalog, TIME, METRIC, LABEL, CATEGORICAL
+    from silvervector.shards import collapse_shard_families
+except ImportError:
+    from tracing import NULL_TRACER
+    from catalog import Column, ForeignKey, Table, SchemaCatalog, TIME, METRIC, LABEL, CATEGORICAL
+    from shards import collapse_shard_families
+
+# Validated, serializable view of a column (the catalog itself stores slotted Column objects)
 class ColumnModel(BaseModel):
     name: str
     data_type: str
@@ -11,28 +25,459 @@ class ColumnModel(BaseModel):
     is_categorical: bool = False
     unit: str = "short"
 
+    @classmethod
+    def from_column(cls, col):
+        return cls(**col.to_dict())
+
+
+# --- Fast path ---
+# Plain `CREATE TABLE name (col TYPE [constraints], ...)` statements are parsed here directly and
+# produce exactly the table dicts DDLParser would; anything outside this small grammar is
+# handed to DDLParser. Every rule below mirrors a DDLParser behaviour, so keep them narrow.
+
+# Any word DDLParser's lexer may treat as a keyword (plus grammar special cases) disables the fast path
+FAST_PATH_KEYWORDS = frozenset(
+    word.upper()
+    for group in (ddl_tokens.definition_statements, ddl_tokens.common_statements, ddl_tokens.columns_definition,
+                  ddl_tokens.first_liners, ddl_tokens.after_columns_tokens, ddl_tokens.sequence_reserved,
+                  ddl_tokens.alter_tokens, ddl_tokens.comment_on_tokens)
+    for word in group
+    if word.isidentifier()
+) | {"IDENTITY", "AUTO", "MAX", "ENCODE", "DISTKEY", "UNSIGNED", "SIGNED", "CHARACTER", "TEMP", "TEMPORARY",
+     "GLOBAL", "EXTERNAL", "TRANSIENT", "OBJECT", "RANGE_BUCKET", "TRUE", "FALSE", "CURRENT_TIMESTAMP"}
+
+FAST_PATH_TYPES = frozenset((
+    "INT", "INTEGER", "BIGINT", "SMALLINT", "TINYINT", "MEDIUMINT", "INT2", "INT4", "INT8",
+    "DECIMAL", "NUMERIC", "FLOAT", "FLOAT4", "FLOAT8", "DOUBLE", "REAL", "MONEY",
+    "CHAR", "VARCHAR", "NCHAR", "NVARCHAR", "TEXT", "NTEXT", "TINYTEXT", "MEDIUMTEXT", "LONGTEXT", "CLOB",
+    "DATE", "TIME", "DATETIME", "DATETIME2", "SMALLDATETIME", "DATETIMEOFFSET", "TIMESTAMP", "TIMESTAMPTZ",
+    "BOOLEAN", "BOOL", "BIT", "BLOB", "BYTEA", "BINARY", "VARBINARY", "UUID", "UNIQUEIDENTIFIER", "JSON", "JSONB",
+))
+FAST_PATH_DEFAULT_WORDS = frozenset(("NULL", "TRUE", "FALSE", "CURRENT_TIMESTAMP"))
+
+FAST_TOKEN = re.compile(r"""\s*(?:
+    (?P<word>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<quoted>\[[A-Za-z_][A-Za-z0-9_]*\]|"[A-Za-z_][A-Za-z0-9_]*"|`[A-Za-z_][A-Za-z0-9_]*`)
+  | (?P<number>[+-]?[0-9]+(?:\.[0-9]+)?)
+  | (?P<string>'[A-Za-z0-9 _.:/+-]*')
+  | (?P<punct>[(),.;])
+)""", re.VERBOSE)
+
+# DDLParser keeps a line verbatim (comment included) when a quote surrounds its "--"
+QUOTED_LINE_COMMENT = re.compile(r"((\")|(\'))+(.)*(--)+(.)*((\")|(\'))+")
+# DDLParser escapes control and non-ASCII characters before reading lines, so only these count as blank
+BLANKS = " \t"
+CONTROL_CHARS = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+EQUALS_AFTER_WORD = re.compile(r"(\b)=")
+LINE_SKIP = re.compile(r"^(?:(?:GO|USE|INSERT|GRANT|DELETE|COMMIT)\b|SET )")
+STATEMENT_HEADS = ("ALTER ", "CREATE ", "DROP ", "SET ")
+CREATE_TABLE_HEAD = re.compile(r"^CREATE\s+TABLE\b", re.IGNORECASE)
+
+
+class FastPathUnsupported(Exception):
+    pass
+
+
+class DDLStatement:
+    __slots__ = ("lines", "code", "comments", "plain")
+
+    def __init__(self):
+        self.lines = []
+        self.code = []
+        self.comments = []  # (column name, comment) per "--" line, as DDLParser attaches them
+        self.plain = True
+
+    @property
+    def text(self):
+        return "\n".join(self.lines)
+
+
+def split_statements(ddl_text):
+    # Splits DDL the way DDLParser's line reader does. Returns None when the text has anything
+    # besides CREATE TABLE statements and "--" comments: those can span or modify tables, so the
+    # whole text then goes to DDLParser.
+    if CONTROL_CHARS.search(ddl_text) or "\\" in ddl_text or "/*" in ddl_text or "*/" in ddl_text \
+            or "#" in ddl_text or "GENERATED" in ddl_text.upper():
+        return None
+
+    statements = []
+    current = None
+    for line in ddl_text.split("\n"):
+        comment = None
+        verbatim = False
+        # DDLParser pads "word=" before reading comments; code with "=" never takes the fast path anyway
+        padded = EQUALS_AFTER_WORD.sub(" = ", line) if "=" in line else line
+        if padded.strip(BLANKS).startswith("--"):
+            code = ""
+        elif "--" in padded:
+            if QUOTED_LINE_COMMENT.search(padded):
+                code = padded
+                verbatim = True
+            else:
+                parts = padded.split("--")
+                code, comment = parts[0], parts[1]
+        else:
+            code = padded
+        code = code.strip(BLANKS)
+
+        if not code:
+            if current is not None:
+                current.lines.append(line)
+            continue
+        if LINE_SKIP.match(code.upper()):
+            return None
+
+        if current is None:
+            if not CREATE_TABLE_HEAD.match(code):
+                return None
+            current = DDLStatement()
+            statements.append(current)
+            depth = 0
+        elif depth == 0 and code.upper().startswith(STATEMENT_HEADS):
+            # New statement without a terminating ';' (DDLParser trims the previous one)
+            return None
+
+        current.lines.append(line)
+        current.code.append(code)
+        current.plain = current.plain and not verbatim
+        depth += code.count("(") - code.count(")")
+        if comment is not None:
+            spaced = code.replace(",", " , ").replace("(", " ( ").replace(")", " ) ")
+            name = DDLParser.extract_column_name_from_line(spaced)
+            if name:
+                current.comments.append((name, comment))
+        if code.endswith(";"):
+            current = None
+
+    return statements
+
+
+class FastTableParser:
+    def __init__(self, statement):
+        self.statement = statement
+        self.tokens = self._tokenize(" ".join(statement.code))
+        self.pos = 0
+
+    @staticmethod
+    def _tokenize(code):
+        tokens = []
+        pos = 0
+        end = len(code.rstrip())
+        while pos < end:
+            match = FAST_TOKEN.match(code, pos)
+            if match is None:
+                raise FastPathUnsupported(code[pos:pos + 20])
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == "string" and "--" in value:
+                raise FastPathUnsupported(value)
+            tokens.append((kind, value))
+            pos = match.end()
+        return tokens
+
+    # --- Token helpers ---
+    def peek(self, offset=0):
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def next(self):
+        token = self.peek()
+        if token[0] is None:
+            raise FastPathUnsupported("unexpected end")
+        self.pos += 1
+        return token
+
+    def accept(self, *words):
+        # Consumes the keyword sequence if it is next
+        for offset, word in enumerate(words):
+            kind, value = self.peek(offset)
+            if kind != "word" or value.upper() != word:
+                return False
+        self.pos += len(words)
+        return True
+
+    def expect(self, *words):
+        if not self.accept(*words):
+            raise FastPathUnsupported(" ".join(words))
+
+    def punct(self, char):
+        if self.peek() == ("punct", char):
+            self.pos += 1
+            return True
+        return False
+
+    def expect_punct(self, char):
+        if not self.punct(char):
+            raise FastPathUnsupported(char)
+
+    def identifier(self, quoted=True):
+        kind, value = self.next()
+        if kind != "word" and not (quoted and kind == "quoted"):
+            raise FastPathUnsupported(value)
+        bare = value.strip('[]"`') if kind == "quoted" else value
+        if bare.upper() in FAST_PATH_KEYWORDS:
+            raise FastPathUnsupported(value)
+        return value
+
+    def unsigned(self):
+        kind, value = self.next()
+        if kind != "number" or not value.isdigit():
+            raise FastPathUnsupported(value)
+        return int(value)
+
+    # --- Grammar ---
+    def parse(self):
+        self.expect("CREATE", "TABLE")
+        if_not_exists = self.accept("IF", "NOT", "EXISTS")
+        schema = None
+        table_name = self.identifier()
+        if self.punct("."):
+            schema, table_name = table_name, self.identifier()
+
+        columns = []
+        inline_pk = []
+        table_pk = None
+        foreign_keys = []
+        self.expect_punct("(")
+        while True:
+            if self.accept("PRIMARY", "KEY"):
+                if table_pk is not None:
+                    raise FastPathUnsupported("second PRIMARY KEY")
+                table_pk = self._column_list()
+            elif self.accept("FOREIGN", "KEY"):
+                fk_columns = self._column_list()
+                if len(fk_columns) != 1:
+                    raise FastPathUnsupported("composite FOREIGN KEY")
+                self.expect("REFERENCES")
+                foreign_keys.append((fk_columns[0], self._reference()))
+            else:
+                columns.append(self._column(inline_pk))
+            if self.punct(")"):
+                break
+            self.expect_punct(",")
+        self.punct(";")
+        if self.peek()[0] is not None:
+            raise FastPathUnsupported("trailing tokens")
+
+        by_name = {}
+        for col in columns:
+            if normalize_name(col["name"]) in by_name:
+                raise FastPathUnsupported("duplicate column")
+            by_name[normalize_name(col["name"])] = col
+
+        if table_pk is not None:
+            if inline_pk:
+                raise FastPathUnsupported("inline and table PRIMARY KEY")
+            for name in table_pk:
+                col = by_name.get(normalize_name(name))
+                if col is None or col["name"] != name or col.get("_explicit_null"):
+                    raise FastPathUnsupported("PRIMARY KEY column")
+                col["nullable"] = False
+        for fk_column, reference in foreign_keys:
+            col = by_name.get(normalize_name(fk_column))
+            if col is None or col["name"] != fk_column or col["references"] is not None:
+                raise FastPathUnsupported("FOREIGN KEY column")
+            col["references"] = reference
+        for col in columns:
+            col.pop("_explicit_null", None)
+
+        self._apply_comments(by_name)
+        table = {
+            "table_name": table_name,
+            "schema": schema,
+            "primary_key": table_pk if table_pk is not None else inline_pk,
+            "columns": columns,
+            "alter": {},
+            "checks": [],
+            "index": [],
+            "partitioned_by": [],
+            "tablespace": None,
+        }
+        if if_not_exists:
+            table["if_not_exists"] = True
+        return table
+
+    def _column_list(self):
+        self.expect_punct("(")
+        names = [self.identifier()]
+        while self.punct(","):
+            names.append(self.identifier())
+        self.expect_punct(")")
+        return names
+
+    def _reference(self):
+        # `table(column)` with an unqualified table and a bare column only: DDLParser reports
+        # schema-qualified, quoted-column and column-less references in other shapes
+        table = self.identifier()
+        self.expect_punct("(")
+        column = self.identifier(quoted=False)
+        self.expect_punct(")")
+        return {
+            "table": table,
+            "schema": None,
+            "on_delete": None,
+            "on_update": None,
+            "deferrable_initially": None,
+            "column": column,
+        }
+
+    def _column(self, inline_pk):
+        name = self.identifier()
+        kind, data_type = self.next()
+        if kind != "word" or data_type.upper() not in FAST_PATH_TYPES:
+            raise FastPathUnsupported(data_type)
+
+        size = None
+        if self.punct("("):
+            size = self.unsigned()
+            if self.punct(","):
+                size = (size, self.unsigned())
+            self.expect_punct(")")
+
+        col = {
+            "name": name,
+            "type": data_type,
+            "size": size,
+            "references": None,
+            "unique": False,
+            "nullable": True,
+            "default": None,
+            "check": None,
+            "_explicit_null": False,
+        }
+        seen = set()
+        while self.peek() not in (("punct", ","), ("punct", ")")):
+            if self.accept("NOT", "NULL"):
+                constraint = "NOT NULL"
+                col["nullable"] = False
+            elif self.accept("NULL"):
+                constraint = "NULL"
+                col["_explicit_null"] = True
+            elif self.accept("PRIMARY", "KEY"):
+                constraint = "PRIMARY KEY"
+                col["nullable"] = False
+                inline_pk.append(name)
+            elif self.accept("UNIQUE"):
+                constraint = "UNIQUE"
+                col["unique"] = True
+            elif self.accept("DEFAULT"):
+                constraint = "DEFAULT"
+                col["default"] = self._default()
+            elif self.accept("REFERENCES"):
+                constraint = "REFERENCES"
+                col["references"] = self._reference()
+                # Anything after an inline REFERENCES changes the shape DDLParser reports
+                if self.peek() not in (("punct", ","), ("punct", ")")):
+                    raise FastPathUnsupported("constraint after REFERENCES")
+            elif self.accept("AUTOINCREMENT"):
+                constraint = "AUTOINCREMENT"
+                col["autoincrement"] = True
+            else:
+                raise FastPathUnsupported(self.peek()[1])
+            if constraint in seen:
+                raise FastPathUnsupported(f"repeated {constraint}")
+            seen.add(constraint)
+
+        if "NULL" in seen and ("NOT NULL" in seen or "PRIMARY KEY" in seen):
+            raise FastPathUnsupported("conflicting NULL")
+        return col
+
+    def _default(self):
+        kind, value = self.next()
+        if kind == "number":
+            # DDLParser returns plain integers as int, everything else as written
+            return int(value) if value.isdigit() else value
+        if kind == "string":
+            return value
+        if kind == "word" and value.upper() in FAST_PATH_DEFAULT_WORDS:
+            return value
+        raise FastPathUnsupported(value)
+
+    def _apply_comments(self, by_name):
+        # Same rule as DDLParser: a "--" comment belongs to the column named first on its line
+        for name, comment in self.statement.comments:
+            comment = DDLParser.normalize_inline_comment(comment)
+            col = by_name.get(normalize_name(name))
+            if comment and col is not None and not col.get("comment"):
+                col["comment"] = comment
+
+
+def fast_parse_statement(statement):
+    # Table dict identical to DDLParser's, or None if the statement needs DDLParser
+    if not statement.plain or not statement.text.isascii():
+        return None
+    try:
+        return FastTableParser(statement).parse()
+    except FastPathUnsupported:
+        return None
+
 class SilverVectorParser:
-    def __init__(self, ddl_text: str):
+    def __init__(self, ddl_text: str, tracer=None, collapse_shards=True):
         self.ddl_text = ddl_text
-        self.tables = []
+        self.tables = SchemaCatalog()
+        self.tracer = tracer or NULL_TRACER
+        self.collapse_shards = collapse_shards
 
     def parse(self):
-        # 1. Run the raw parser
-        parser = DDLParser(self.ddl_text)
-        raw_results = parser.run(group_by_type=True)
+        # 1. Run the raw parser (fast path first, DDLParser for whatever it can't handle)
+        raw_tables = self._raw_tables()
 
         # 2. Refine the results with SilverVector Logic
-        for table in raw_results.get("tables", []):
+        for table in raw_tables:
             refined_cols = []
-            for col in table["columns"]:
-                refined_cols.append(self._classify_column(col))
-            
-            self.tables.append({
-                "name": table["table_name"],
-                "columns": refined_cols
-            })
+            with self.tracer.span(f"classify {table['table_name']}", "classify", columns=len(table["columns"])):
+                for col in table["columns"]:
+                    refined_cols.append(self._classify_column(col))
+
+            self.tables.add(Table(
+                table["table_name"],
+                refined_cols,
+                primary_key=table.get("primary_key") or (),
+                foreign_keys=self._foreign_keys(table),
+            ))
+
+        # 3. Period shards (SystemLogs_2026_09, SystemLogs_2026_10, ...) -> one logical table
+        if self.collapse_shards:
+            with self.tracer.span("collapse shards", "classify"):
+                self.tables = collapse_shard_families(self.tables)
         return self.tables
 
+    def _raw_tables(self):
+        with self.tracer.span("fast path", "parse", chars=len(self.ddl_text)):
+            statements = split_statements(self.ddl_text)
+            parsed = [] if statements is None else [(s, fast_parse_statement(s)) for s in statements]
+        if statements is None:
+            return self._run_ddl_parser(self.ddl_text)
+
+        # Consecutive leftovers go to DDLParser together (one lexer/parser setup per run)
+        tables = []
+        pending = []
+        for statement, table in parsed:
+            if table is None:
+                pending.append(statement.text)
+                continue
+            if pending:
+                tables.extend(self._run_ddl_parser("\n".join(pending)))
+                pending = []
+            tables.append(table)
+        if pending:
+            tables.extend(self._run_ddl_parser("\n".join(pending)))
+        return tables
+
+    def _run_ddl_parser(self, ddl_text):
+        with self.tracer.span("DDLParser.run", "parse", chars=len(ddl_text)):
+            return DDLParser(ddl_text).run(group_by_type=True).get("tables", [])
+
+    def _foreign_keys(self, table):
+        # Inline REFERENCES / table-level FOREIGN KEY land on the column,
+        # ALTER TABLE ... ADD FOREIGN KEY lands under "alter"
+        cols = list(table["columns"]) + list(table.get("alter", {}).get("columns", []))
+        return [
+            ForeignKey(col["name"], col["references"]["table"], col["references"].get("column"))
+            for col in cols
+            if col.get("references") and col["references"].get("table")
+        ]
+
     def _classify_column(self, col):
         name = col["name"].lower()
         ctype = col["type"].lower()
@@ -88,12 +533,10 @@ class SilverVectorParser:
             "mode" in name
         )
 
-        return ColumnModel(
-            name=col["name"],
-            data_type=ctype,
-            is_time_col=is_time,
-            is_metric=is_metric,
-            is_label=is_label,
-            is_categorical=is_categorical,
-            unit=unit
-        )
\ No newline at end of file
+        flags = (
+            (TIME if is_time else 0) |
+            (METRIC if is_metric else 0) |
+            (LABEL if is_label else 0) |
+            (CATEGORICAL if is_categorical else 0)
+        )
+        return Column(col["name"], ctype, flags, unit)
\ No newline at end of file
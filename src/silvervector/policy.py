@@ -0,0 +1,170 @@
+import pathlib
+import sqlite3
+import time
+
+# Baseline caching per kind of query (seconds a result stays good enough)
+#   trend:        live time-series over the dashboard range
+#   window_stat:  aggregate over the dashboard range (e.g. revenue in range)
+#   distribution: GROUP BY breakdowns, slow-moving
+#   total:        all-time count(*) style totals
+#   estimate:     row counts read from engine statistics (only change on ANALYZE)
+#   recent:       latest-N rows tables
+KIND_TTL_SECONDS = {
+    "trend": 60,
+    "window_stat": 300,
+    "distribution": 900,
+    "total": 3600,
+    "estimate": 3600,
+    "recent": 60,
+}
+KIND_MAX_DATA_POINTS = {
+    "trend": 1000,
+}
+MAX_TTL_SECONDS = 86400
+
+# A query that takes N seconds is cached for at least N * factor (cost-aware TTL)
+COST_TTL_FACTOR = 60
+PROFILE_TIMEOUT_SECONDS = 5.0
+PROFILE_RANGE_SECONDS = 30 * 86400
+
+# Grafana's refresh picker values, fastest first
+REFRESH_CHOICES = (
+    ("10s", 10), ("30s", 30), ("1m", 60), ("5m", 300), ("15m", 900),
+    ("30m", 1800), ("1h", 3600), ("2h", 7200), ("1d", 86400),
+)
+
+
+class PanelPolicy:
+    __slots__ = ("kind", "ttl_seconds", "max_data_points", "interval")
+
+    def __init__(self, kind, ttl_seconds, max_data_points=None, interval=None):
+        self.kind = kind
+        self.ttl_seconds = ttl_seconds
+        self.max_data_points = max_data_points
+        self.interval = interval
+
+    def apply(self, panel):
+        panel["cacheTimeout"] = format_duration(self.ttl_seconds)
+        panel["queryCachingTTL"] = self.ttl_seconds * 1000
+        if self.max_data_points:
+            panel["maxDataPoints"] = self.max_data_points
+        if self.interval:
+            panel["interval"] = self.interval
+
+
+def format_duration(seconds):
+    for suffix, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size and seconds % size == 0:
+            return f"{seconds // size}{suffix}"
+    return f"{seconds}s"
+
+
+def cheapest_refresh(ttl_seconds):
+    # Slowest refresh that still picks up the freshest panel's updates
+    choice = REFRESH_CHOICES[0][0]
+    for label, seconds in REFRESH_CHOICES:
+        if seconds <= ttl_seconds:
+            choice = label
+    return choice
+
+
+class SampleProfiler:
+    # Measures real query cost and table growth on a sample SQLite database (opened read-only)
+    def __init__(self, db_path, timeout=PROFILE_TIMEOUT_SECONDS, now=None):
+        uri = pathlib.Path(db_path).resolve().as_uri() + "?mode=ro"
+        self.conn = sqlite3.connect(uri, uri=True)
+        self.timeout = timeout
+        # Left unset until anchor(): a sample is a snapshot, so "now" is its newest row
+        self.now = int(now) if now is not None else None
+        self._growth = {}
+
+    def latest(self, table, time_column):
+        try:
+            row = self.conn.execute(f"SELECT unixepoch(MAX({time_column})) FROM {table}").fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return row[0]
+
+    def anchor(self, growth_sources):
+        # Measure growth and profile ranges relative to when the sample was taken, not to the
+        # wall clock; otherwise a sample copied a few days ago makes every table look idle
+        if self.now is not None:
+            return
+        latest = [t for t in (self.latest(*source) for source in set(growth_sources)) if t is not None]
+        self.now = max(latest) if latest else int(time.time())
+
+    def _bind_range(self, sql_query):
+        # Stand in for Grafana's range macros with the default dashboard range
+        to_ms = self.now * 1000
+        from_ms = (self.now - PROFILE_RANGE_SECONDS) * 1000
+        return sql_query.replace("$__from", str(from_ms)).replace("$__to", str(to_ms))
+
+    def query_seconds(self, sql_query):
+        deadline = time.perf_counter() + self.timeout
+        self.conn.set_progress_handler(lambda: int(time.perf_counter() > deadline), 10000)
+        started = time.perf_counter()
+        try:
+            self.conn.execute(self._bind_range(sql_query)).fetchall()
+        except sqlite3.OperationalError:
+            # Interrupted (too slow) or not runnable on the sample: assume the worst
+            return self.timeout
+        finally:
+            self.conn.set_progress_handler(None, 0)
+        return time.perf_counter() - started
+
+    def rows_per_day(self, table, time_column):
+        key = (table, time_column)
+        if key not in self._growth:
+            try:
+                row = self.conn.execute(
+                    f"SELECT count(*) FROM {table} WHERE unixepoch({time_column}) >= ?",
+                    (self.now - 86400,),
+                ).fetchone()
+                self._growth[key] = row[0]
+            except sqlite3.OperationalError:
+                self._growth[key] = None
+        return self._growth[key]
+
+    def close(self):
+        self.conn.close()
+
+
+def plan_policy(panel, meta, profiler=None):
+    kind = meta.get("kind", "trend")
+    ttl = KIND_TTL_SECONDS.get(kind, 60)
+    interval = None
+    if meta.get("bucket_seconds"):
+        interval = format_duration(meta["bucket_seconds"])
+
+    if profiler is not None:
+        # Expensive queries earn a longer cache
+        cost = profiler.query_seconds(panel["targets"][0]["rawSql"])
+        ttl = max(ttl, int(cost * COST_TTL_FACTOR))
+
+        # No point refreshing faster than rows arrive
+        for table, time_column in meta.get("growth_sources", ()):
+            per_day = profiler.rows_per_day(table, time_column)
+            if per_day is None:
+                continue
+            seconds_between_rows = MAX_TTL_SECONDS if per_day == 0 else 86400 // per_day
+            ttl = max(ttl, seconds_between_rows)
+
+    ttl = min(ttl, MAX_TTL_SECONDS)
+    return PanelPolicy(kind, ttl, KIND_MAX_DATA_POINTS.get(kind), interval)
+
+
+def apply_query_policies(panels, panel_meta, sample_db=None):
+    profiler = SampleProfiler(sample_db) if sample_db else None
+    try:
+        if profiler is not None:
+            profiler.anchor(source for meta in panel_meta.values() for source in meta.get("growth_sources", ()))
+        ttls = []
+        for panel in panels:
+            policy = plan_policy(panel, panel_meta.get(panel["id"], {}), profiler)
+            policy.apply(panel)
+            ttls.append(policy.ttl_seconds)
+    finally:
+        if profiler is not None:
+            profiler.close()
+
+    return cheapest_refresh(min(ttls)) if ttls else cheapest_refresh(MAX_TTL_SECONDS)
@@ -0,0 +1,235 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Try importing from package, fallback to local if running script directly
+try:
+    from silvervector.parser import SilverVectorParser
+    from silvervector.generator import DashboardGenerator, ROW_COUNT_MODES
+except ImportError:
+    from parser import SilverVectorParser
+    from generator import DashboardGenerator, ROW_COUNT_MODES
+
+DASHBOARDS_DIR = "dashboards"
+PROVIDER_PATH = os.path.join("provisioning", "dashboards", "silvervector.yaml")
+# Kept outside dashboards/ so Grafana never tries to load it as a dashboard
+MANIFEST_NAME = ".silvervector-manifest.json"
+# Grafana's root folder: its dashboards sit directly in dashboards/, since a "General"
+# directory would become a real folder with that name
+DEFAULT_FOLDER = "General"
+
+
+class ProvisionedDashboard:
+    __slots__ = ("folder", "name", "dashboard")
+
+    def __init__(self, folder, name, dashboard):
+        self.folder = folder_title(folder)
+        self.name = name
+        self.dashboard = dashboard
+
+    @property
+    def relative_path(self):
+        if self.folder == DEFAULT_FOLDER:
+            return f"{DASHBOARDS_DIR}/{slugify(self.name)}.json"
+        return f"{DASHBOARDS_DIR}/{self.folder}/{slugify(self.name)}.json"
+
+
+class ExportReport:
+    def __init__(self):
+        self.written = []
+        self.unchanged = []
+        self.removed = []
+
+    def summary(self):
+        return f"{len(self.written)} written, {len(self.unchanged)} unchanged, {len(self.removed)} removed"
+
+
+def folder_title(folder):
+    # The folder title doubles as its directory name (foldersFromFilesStructure), so the file
+    # export and the API publisher end up with the same folders. Only path-unsafe characters go.
+    title = re.sub(r'[\\/:*?"<>|\x00-\x1f]+', "-", folder or "").strip(" .-")
+    return title or DEFAULT_FOLDER
+
+
+def slugify(text):
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "-", text).strip("-")
+    return slug or "dashboard"
+
+
+def stable_uid(folder, name):
+    # Same schema -> same uid on every run, so Grafana updates instead of duplicating (max 40 chars)
+    return hashlib.sha1(f"{folder}/{name}".encode("utf-8")).hexdigest()[:40]
+
+
+def dashboard_model(item):
+    dashboard = dict(item.dashboard)
+    dashboard["uid"] = stable_uid(item.folder, item.name)
+    dashboard["title"] = item.name
+    dashboard["id"] = None
+    return dashboard
+
+
+def render(item):
+    # sort_keys makes the bytes (and hash) depend only on content, not dict order
+    return json.dumps(dashboard_model(item), indent=2, sort_keys=True).encode("utf-8")
+
+
+def provider_yaml(dashboards_path, provider_name="SilverVector"):
+    return (
+        "apiVersion: 1\n"
+        "providers:\n"
+        f"  - name: '{provider_name}'\n"
+        "    orgId: 1\n"
+        "    type: file\n"
+        "    disableDeletion: false\n"
+        "    allowUiUpdates: false\n"
+        "    updateIntervalSeconds: 30\n"
+        "    options:\n"
+        f"      path: '{dashboards_path}'\n"
+        "      foldersFromFilesStructure: true\n"
+    ).encode("utf-8")
+
+
+def default_file_mode():
+    # The mode a plain open() would give: 0666 minus the umask. The umask can only be read by
+    # setting it (process-wide), so call this before starting writer threads.
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def write_atomic(path, data, mode=None):
+    # Write to a sibling temp file, then rename over the target: readers (Grafana's
+    # watcher) only ever see the old or the new file, never a partial one.
+    # The .tmp suffix keeps the half-written file out of Grafana's *.json scan.
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        # mkstemp creates 0600 and os.replace keeps it, but Grafana usually runs as its own user
+        os.fchmod(fd, default_file_mode() if mode is None else mode)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), 'r') as f:
+            return json.load(f).get("files", {})
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def export_provisioning(items, out_dir, workers=8, grafana_path=None, prune=True, provider_name="SilverVector"):
+    out_dir = os.path.abspath(out_dir)
+    previous = load_manifest(out_dir)
+    mode = default_file_mode()
+    report = ExportReport()
+
+    files = {}
+    items = list(items)
+    seen = set()
+    for item in items:
+        if item.relative_path in seen:
+            raise ValueError(f"Two dashboards map to {item.relative_path}; names must be unique per folder.")
+        seen.add(item.relative_path)
+
+    def sync(relative_path, data):
+        digest = hashlib.sha256(data).hexdigest()
+        target = os.path.join(out_dir, *relative_path.split("/"))
+        if previous.get(relative_path) == digest and os.path.exists(target):
+            return relative_path, digest, False
+        write_atomic(target, data, mode)
+        return relative_path, digest, True
+
+    jobs = [(PROVIDER_PATH.replace(os.sep, "/"),
+             lambda: provider_yaml(grafana_path or os.path.join(out_dir, DASHBOARDS_DIR), provider_name))]
+    jobs += [(item.relative_path, (lambda item=item: render(item))) for item in items]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(lambda job: sync(job[0], job[1]()), jobs)
+        for relative_path, digest, changed in results:
+            files[relative_path] = digest
+            (report.written if changed else report.unchanged).append(relative_path)
+
+    # Only files this exporter wrote before are candidates for removal
+    if prune:
+        for relative_path in previous:
+            if relative_path not in files:
+                target = os.path.join(out_dir, *relative_path.split("/"))
+                if os.path.exists(target):
+                    os.remove(target)
+                    # An emptied directory would linger in Grafana as an empty folder
+                    folder_dir = os.path.dirname(target)
+                    if folder_dir != os.path.join(out_dir, DASHBOARDS_DIR) and not os.listdir(folder_dir):
+                        os.rmdir(folder_dir)
+                report.removed.append(relative_path)
+
+    write_atomic(os.path.join(out_dir, MANIFEST_NAME),
+                 json.dumps({"files": files}, indent=2, sort_keys=True).encode("utf-8"), mode)
+    return report
+
+
+# --- Schema directory -> dashboards ---
+
+def _generate_from_file(path, options):
+    with open(path, 'r') as f:
+        tables = SilverVectorParser(f.read()).parse()
+    if not tables:
+        return None
+    return DashboardGenerator(tables, **options).generate()
+
+
+def build_from_schema_dir(schema_dir, options=None, workers=None):
+    # Every *.sql becomes a dashboard named after the file, in a folder named after its directory
+    paths = []
+    for root, _dirs, names in os.walk(schema_dir):
+        for name in sorted(names):
+            if name.lower().endswith(".sql"):
+                paths.append(os.path.join(root, name))
+    paths.sort()
+
+    # Parsing is CPU-bound, so spread it over processes
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        dashboards = pool.map(_generate_from_file, paths, [options or {}] * len(paths))
+        items = []
+        for path, dashboard in zip(paths, dashboards):
+            if dashboard is None:
+                continue
+            relative_dir = os.path.relpath(os.path.dirname(path), schema_dir)
+            folder = DEFAULT_FOLDER if relative_dir == os.curdir else relative_dir.replace(os.sep, " - ")
+            items.append(ProvisionedDashboard(folder, os.path.splitext(os.path.basename(path))[0], dashboard))
+    return items
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Write a Grafana file-provisioning tree from a directory of DDL files")
+    arg_parser.add_argument("schema_dir")
+    arg_parser.add_argument("out_dir")
+    arg_parser.add_argument("--dialect", default="sqlite")
+    arg_parser.add_argument("--row-counts", default="exact", choices=ROW_COUNT_MODES,
+                            help="How 'Total Records' stats count rows")
+    arg_parser.add_argument("--workers", type=int, default=8)
+    arg_parser.add_argument("--grafana-path", help="Dashboards path as seen by Grafana (defaults to OUT_DIR/dashboards)")
+    arg_parser.add_argument("--no-prune", action="store_true", help="Keep dashboards whose schema file disappeared")
+    args = arg_parser.parse_args(argv)
+
+    items = build_from_schema_dir(args.schema_dir, {"dialect": args.dialect, "row_counts": args.row_counts})
+    report = export_provisioning(items, args.out_dir, workers=args.workers,
+                                 grafana_path=args.grafana_path, prune=not args.no_prune)
+    print(f"Provisioned {len(items)} dashboards into {args.out_dir}: {report.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+import argparse
+import http.client
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+# Try importing from package, fallback to local if running script directly
+try:
+    from silvervector.generator import ROW_COUNT_MODES
+    from silvervector.provisioning import DEFAULT_FOLDER, build_from_schema_dir, dashboard_model, stable_uid
+except ImportError:
+    from generator import ROW_COUNT_MODES
+    from provisioning import DEFAULT_FOLDER, build_from_schema_dir, dashboard_model, stable_uid
+
+# Grafana (or a proxy in front of it) asking us to slow down / briefly unavailable
+RETRY_STATUSES = {429, 502, 503, 504}
+FOLDER_PAGE_SIZE = 1000
+# Longest a worker waits between attempts, whatever Retry-After asks for
+MAX_BACKOFF_SECONDS = 30.0
+TOKEN_ENV = "GRAFANA_TOKEN"
+
+
+class PublishError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class PublishReport:
+    def __init__(self):
+        self.published = []
+        self.failed = []
+        self.folders_created = []
+
+    def summary(self):
+        return (f"{len(self.published)} published, {len(self.failed)} failed, "
+                f"{len(self.folders_created)} folders created")
+
+
+# --- Connection Pool ---
+class ConnectionPool:
+    # Keep-alive connections shared by the publishing threads. Each TLS/TCP handshake
+    # is paid once per connection instead of once per dashboard.
+
+    def __init__(self, url, size=8, timeout=30.0):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Grafana URL must look like http(s)://host[:port], got '{url}'.")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.base_path = parts.path.rstrip("/")
+        self.size = size
+        self.timeout = timeout
+        self.opened = 0
+        self._idle = queue.LifoQueue()
+        # Bounds in-flight requests; threads beyond `size` wait for a free connection
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        conn_cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        with self._lock:
+            self.opened += 1
+        return conn_cls(self.host, self.port, timeout=self.timeout)
+
+    def request(self, method, path, body=None, headers=None):
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+            try:
+                conn.request(method, self.base_path + path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                data = response.read()
+            except BaseException:
+                # The server may have dropped an idle keep-alive connection; never reuse it
+                conn.close()
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self._idle.put(conn)
+            return response.status, response.getheader("Retry-After"), data
+        finally:
+            self._slots.release()
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+# --- Grafana API Client ---
+class GrafanaClient:
+    def __init__(self, url, token=None, pool_size=8, retries=3, backoff=0.5, timeout=30.0,
+                 max_backoff=MAX_BACKOFF_SECONDS):
+        self.pool = ConnectionPool(url, size=pool_size, timeout=timeout)
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        if token:
+            self.headers["Authorization"] = f"Bearer {token}"
+
+    def request(self, method, path, payload=None):
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+            try:
+                status, retry_after, data = self.pool.request(method, path, body, self.headers)
+            except (OSError, http.client.HTTPException) as e:
+                if last_attempt:
+                    raise PublishError(None, f"{method} {path} failed: {e}")
+                self._sleep(attempt)
+                continue
+            if status in RETRY_STATUSES and not last_attempt:
+                self._sleep(attempt, retry_after)
+                continue
+            try:
+                result = json.loads(data) if data else None
+            except ValueError:
+                result = None
+            if status >= 400:
+                message = result.get("message") if isinstance(result, dict) else None
+                raise PublishError(status, f"{method} {path} returned {status}: {message or data[:200]!r}")
+            return result
+
+    def _sleep(self, attempt, retry_after=None):
+        time.sleep(self.retry_delay(attempt, retry_after))
+
+    def retry_delay(self, attempt, retry_after=None):
+        # Exponential backoff; a numeric Retry-After from the server wins. Both are capped so a
+        # proxy asking for an hour cannot park a pooled worker that long.
+        delay = self.backoff * (2 ** attempt)
+        if retry_after is not None:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                pass
+        return min(max(delay, 0.0), self.max_backoff)
+
+    def list_folders(self):
+        folders = []
+        page = 1
+        while True:
+            batch = self.request("GET", f"/api/folders?limit={FOLDER_PAGE_SIZE}&page={page}") or []
+            folders.extend(batch)
+            if len(batch) < FOLDER_PAGE_SIZE:
+                return folders
+            page += 1
+
+    def create_folder(self, uid, title):
+        return self.request("POST", "/api/folders", {"uid": uid, "title": title})
+
+    def save_dashboard(self, dashboard, folder_uid=None, message=None):
+        payload = {"dashboard": dashboard, "overwrite": True}
+        if folder_uid:
+            payload["folderUid"] = folder_uid
+        if message:
+            payload["message"] = message
+        return self.request("POST", "/api/dashboards/db", payload)
+
+    def close(self):
+        self.pool.close()
+
+
+# --- Publishing ---
+def folder_uid(title):
+    return stable_uid("folders", title)
+
+
+def ensure_folders(client, titles, workers=8):
+    # One listing call for all folders, then create only the missing ones in parallel.
+    # Returns folder title -> uid ("General" is Grafana's root and has no uid).
+    existing = {f["title"]: f["uid"] for f in client.list_folders()}
+    uids = {DEFAULT_FOLDER: None}
+    missing = []
+    for title in sorted(set(titles) - {DEFAULT_FOLDER}):
+        if title in existing:
+            uids[title] = existing[title]
+        else:
+            uids[title] = folder_uid(title)
+            missing.append(title)
+
+    def create(title):
+        try:
+            client.create_folder(uids[title], title)
+        except PublishError as e:
+            # Created concurrently by someone else (or by our own retried request)
+            if e.status not in (409, 412):
+                raise
+        return title
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        created = list(pool.map(create, missing))
+    return uids, created
+
+
+def publish_dashboards(items, client, workers=8, message="Published by SilverVector"):
+    items = list(items)
+    report = PublishReport()
+    uids, report.folders_created = ensure_folders(client, [item.folder for item in items], workers)
+
+    def push(item):
+        try:
+            client.save_dashboard(dashboard_model(item), uids[item.folder], message)
+            return item, None
+        except PublishError as e:
+            return item, str(e)
+
+    # One slow or broken dashboard is reported, not fatal for the rest of the batch
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for item, error in pool.map(push, items):
+            if error is None:
+                report.published.append(f"{item.folder}/{item.name}")
+            else:
+                report.failed.append((f"{item.folder}/{item.name}", error))
+    return report
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Generate dashboards from a directory of DDL files and push them to Grafana")
+    arg_parser.add_argument("schema_dir")
+    arg_parser.add_argument("grafana_url", help="e.g. http://localhost:3000")
+    arg_parser.add_argument("--dialect", default="sqlite")
+    arg_parser.add_argument("--row-counts", default="exact", choices=ROW_COUNT_MODES,
+                            help="How 'Total Records' stats count rows")
+    arg_parser.add_argument("--workers", type=int, default=8, help="Concurrent uploads (and pooled connections)")
+    arg_parser.add_argument("--retries", type=int, default=3)
+    arg_parser.add_argument("--max-backoff", type=float, default=MAX_BACKOFF_SECONDS,
+                            help="Upper bound in seconds for a single retry wait (caps Retry-After)")
+    args = arg_parser.parse_args(argv)
+
+    # Read from the environment so the token never shows up in shell history or `ps`
+    token = os.environ.get(TOKEN_ENV)
+    items = build_from_schema_dir(args.schema_dir, {"dialect": args.dialect, "row_counts": args.row_counts})
+    client = GrafanaClient(args.grafana_url, token, pool_size=args.workers, retries=args.retries,
+                           max_backoff=args.max_backoff)
+    try:
+        report = publish_dashboards(items, client, workers=args.workers)
+    finally:
+        client.close()
+    for name, error in report.failed:
+        print(f"FAILED {name}: {error}")
+    print(f"Pushed {len(items)} dashboards to {args.grafana_url}: {report.summary()}")
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,389 @@
+import argparse
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from simple_ddl_parser import DDLParser
+
+# Try importing from package, fallback to local if running script directly
+try:
+    from silvervector.parser import SilverVectorParser
+    from silvervector.generator import DashboardGenerator
+except ImportError:
+    from parser import SilverVectorParser
+    from generator import DashboardGenerator
+
+MAX_BODY_BYTES = 16 * 1024 * 1024
+# Generator options a client may set over HTTP. Everything else (sample_db, tracer, packs)
+# takes server-side paths or objects and must never come from a request.
+GENERATE_OPTIONS = frozenset((
+    "dialect", "continuous_aggregates", "suggest_joins", "max_join_panels", "query_policies", "row_counts",
+))
+WARMUP_DDL = "CREATE TABLE warmup (id INT PRIMARY KEY, created_at TIMESTAMP);"
+
+
+class ServiceError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+    def __reduce__(self):
+        # Raised inside pool workers, so it has to survive pickling
+        return (ServiceError, (self.status, str(self)))
+
+
+# --- Worker Side ---
+# These run inside the pool processes, so they only take/return plain data.
+
+def _warm_worker():
+    # Pay the simple_ddl_parser/PLY table build once per worker, not per request. Plain DDL
+    # like WARMUP_DDL takes the parser's fast path, so DDLParser has to be run directly.
+    SilverVectorParser(WARMUP_DDL).parse()
+    DDLParser(WARMUP_DDL).run(group_by_type=True)
+
+def _ping():
+    return True
+
+def _parse_or_fail(ddl):
+    tables = SilverVectorParser(ddl).parse()
+    if not tables:
+        raise ServiceError(422, "No valid tables found.")
+    return tables
+
+def run_generate(ddl, options):
+    tables = _parse_or_fail(ddl)
+    try:
+        generator = DashboardGenerator(tables, **options)
+    except (TypeError, ValueError) as e:
+        # Unknown generator options (or values, e.g. dialect) surface from the constructor
+        raise ServiceError(400, f"Invalid options: {e}")
+    dashboard = generator.generate()
+    return json.dumps(dashboard, indent=2).encode("utf-8")
+
+def run_analyze(ddl, options):
+    catalog = _parse_or_fail(ddl)
+    return json.dumps(catalog.to_dict(), indent=2).encode("utf-8")
+
+JOBS = {
+    "/generate": run_generate,
+    "/analyze": run_analyze,
+}
+
+
+# --- Response Cache ---
+class ResponseCache:
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(endpoint, ddl, options):
+        digest = hashlib.sha256()
+        digest.update(endpoint.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(ddl.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(json.dumps(options, sort_keys=True).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key, body):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def snapshot(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# --- Request Metrics ---
+class ServiceMetrics:
+    def __init__(self, window=1024):
+        self.window = window
+        self._lock = threading.Lock()
+        self._endpoints = {}
+        self.in_flight = 0
+        self.rejected = 0
+
+    def record(self, endpoint, status, seconds):
+        with self._lock:
+            stats = self._endpoints.setdefault(endpoint, {
+                "count": 0,
+                "errors": 0,
+                "total_seconds": 0.0,
+                "recent": deque(maxlen=self.window),
+            })
+            stats["count"] += 1
+            stats["total_seconds"] += seconds
+            stats["recent"].append(seconds)
+            if status >= 400:
+                stats["errors"] += 1
+
+    def track_in_flight(self, delta):
+        with self._lock:
+            self.in_flight += delta
+
+    def record_rejected(self):
+        with self._lock:
+            self.rejected += 1
+
+    def snapshot(self):
+        with self._lock:
+            endpoints = {}
+            for endpoint, stats in self._endpoints.items():
+                recent = sorted(stats["recent"])
+                endpoints[endpoint] = {
+                    "count": stats["count"],
+                    "errors": stats["errors"],
+                    "latency_ms": {
+                        "mean": round(stats["total_seconds"] / stats["count"] * 1000, 3),
+                        "p50": _percentile_ms(recent, 0.50),
+                        "p95": _percentile_ms(recent, 0.95),
+                        "p99": _percentile_ms(recent, 0.99),
+                        "max": round(recent[-1] * 1000, 3),
+                    },
+                }
+            return {"in_flight": self.in_flight, "rejected": self.rejected, "endpoints": endpoints}
+
+def _percentile_ms(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return round(sorted_values[index] * 1000, 3)
+
+
+# --- Service ---
+class GenerationService:
+    def __init__(self, workers=2, max_concurrent=8, queue_timeout=5.0, cache_size=256, job_timeout=60.0):
+        self.workers = workers
+        self.queue_timeout = queue_timeout
+        self.job_timeout = job_timeout
+        self.cache = ResponseCache(cache_size)
+        self.metrics = ServiceMetrics()
+        self.pool_restarts = 0
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._pool_lock = threading.Lock()
+        self._pool = self._new_pool()
+        self.started_at = time.time()
+
+    def _new_pool(self):
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_worker)
+
+    def _replace_pool(self, failed_pool):
+        # A dead worker (OOM, kill, segfault) breaks the whole executor, and a hung one can't be
+        # cancelled, so swap in a fresh pool. Requests that saw the same failure only replace it once.
+        with self._pool_lock:
+            if self._pool is not failed_pool:
+                return
+            self._pool = self._new_pool()
+            self.pool_restarts += 1
+            # Spawn (and warm) the new workers now, without holding up this request
+            for _ in range(self.workers):
+                self._pool.submit(_ping)
+        # Stop whatever the old workers are still chewing on
+        for process in list((getattr(failed_pool, "_processes", None) or {}).values()):
+            process.terminate()
+        failed_pool.shutdown(wait=False, cancel_futures=True)
+
+    def warm_up(self):
+        # Submitting one job per worker makes the pool spawn (and warm) all of them now
+        for future in [self._pool.submit(_ping) for _ in range(self.workers)]:
+            future.result()
+
+    def handle(self, endpoint, body):
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            raise ServiceError(400, "Request body must be valid JSON.")
+        if not isinstance(payload, dict):
+            raise ServiceError(400, "Request body must be a JSON object.")
+
+        ddl = payload.get("ddl")
+        options = payload.get("options") or {}
+        if not isinstance(ddl, str) or not ddl.strip():
+            raise ServiceError(400, "Field 'ddl' must be a non-empty string.")
+        if not isinstance(options, dict):
+            raise ServiceError(400, "Field 'options' must be an object.")
+        unknown = sorted(set(options) - GENERATE_OPTIONS)
+        if unknown:
+            raise ServiceError(400, f"Invalid options: unsupported {', '.join(unknown)}. "
+                                    f"Allowed: {', '.join(sorted(GENERATE_OPTIONS))}")
+
+        key = ResponseCache.make_key(endpoint, ddl, options)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached, True
+
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            self.metrics.record_rejected()
+            raise ServiceError(503, "Too many concurrent requests, try again later.")
+        try:
+            self.metrics.track_in_flight(1)
+            pool = self._pool
+            try:
+                response = pool.submit(JOBS[endpoint], ddl, options).result(timeout=self.job_timeout)
+            except ServiceError:
+                raise
+            except BrokenProcessPool:
+                self._replace_pool(pool)
+                raise ServiceError(503, "A generation worker crashed; the pool was restarted, try again.")
+            except FutureTimeout:
+                self._replace_pool(pool)
+                raise ServiceError(504, f"Generation took longer than {self.job_timeout:g}s.")
+            except Exception as e:
+                raise ServiceError(422, f"Generation failed: {e}")
+        finally:
+            self.metrics.track_in_flight(-1)
+            self._slots.release()
+
+        self.cache.put(key, response)
+        return response, False
+
+    def metrics_body(self):
+        snapshot = self.metrics.snapshot()
+        snapshot["cache"] = self.cache.snapshot()
+        snapshot["workers"] = self.workers
+        snapshot["pool_restarts"] = self.pool_restarts
+        snapshot["uptime_seconds"] = round(time.time() - self.started_at, 3)
+        return json.dumps(snapshot, indent=2).encode("utf-8")
+
+    def shutdown(self):
+        self._pool.shutdown(cancel_futures=True)
+
+
+def error_body(message):
+    return json.dumps({"error": message}).encode("utf-8")
+
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    server_version = "SilverVector"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def do_GET(self):
+        started = time.perf_counter()
+        if self.path == "/metrics":
+            status, body = 200, self.service.metrics_body()
+        elif self.path == "/health":
+            status, body = 200, b'{"status": "ok"}'
+        else:
+            status, body = 404, error_body("Not found.")
+        # Recorded before replying, so a client's next /metrics call always includes this request
+        self.service.metrics.record(f"GET {self.path}", status, time.perf_counter() - started)
+        self._respond(status, body)
+
+    def do_POST(self):
+        started = time.perf_counter()
+        headers = None
+        # Any body left unread would be parsed as the next request on this keep-alive connection,
+        # so only keep the connection once the body has been consumed
+        keep_alive = not self.close_connection
+        self.close_connection = True
+        if self.path not in JOBS:
+            status, body = 404, error_body("Not found.")
+        else:
+            try:
+                try:
+                    length = int(self.headers.get("Content-Length") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    raise ServiceError(400, "Invalid Content-Length header.")
+                if length > MAX_BODY_BYTES:
+                    raise ServiceError(413, "Request body too large.")
+                request_body = self.rfile.read(length)
+                self.close_connection = not keep_alive
+                body, cache_hit = self.service.handle(self.path, request_body)
+                status, headers = 200, {"X-Cache": "HIT" if cache_hit else "MISS"}
+            except ServiceError as e:
+                status, body = e.status, error_body(str(e))
+        self.service.metrics.record(f"POST {self.path}", status, time.perf_counter() - started)
+        self._respond(status, body, headers)
+
+    def _respond(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status == 503:
+            self.send_header("Retry-After", "1")
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keep the console quiet; /metrics is the place to look
+        pass
+
+
+def create_server(host="127.0.0.1", port=8765, **service_options):
+    service = GenerationService(**service_options)
+    service.warm_up()
+    httpd = ThreadingHTTPServer((host, port), ServiceRequestHandler)
+    httpd.daemon_threads = True
+    httpd.service = service
+    return httpd
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="SilverVector local generation service")
+    arg_parser.add_argument("--host", default="127.0.0.1")
+    arg_parser.add_argument("--port", type=int, default=8765)
+    arg_parser.add_argument("--workers", type=int, default=2)
+    arg_parser.add_argument("--max-concurrent", type=int, default=8)
+    arg_parser.add_argument("--cache-size", type=int, default=256)
+    arg_parser.add_argument("--job-timeout", type=float, default=60.0,
+                            help="Seconds one generation may take before its worker is recycled")
+    args = arg_parser.parse_args(argv)
+
+    httpd = create_server(
+        args.host, args.port,
+        workers=args.workers,
+        max_concurrent=args.max_concurrent,
+        cache_size=args.cache_size,
+        job_timeout=args.job_timeout,
+    )
+    print(f"SilverVector service listening on http://{args.host}:{httpd.server_address[1]}")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        httpd.service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
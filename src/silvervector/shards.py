@@ -0,0 +1,95 @@
+import re
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+# Try importing from package, fallback to local if running script directly
+try:
+    from silvervector.catalog import Column, SchemaCatalog, Shard, Table
+except ImportError:
+    from catalog import Column, SchemaCatalog, Shard, Table
+
+# Period suffixes of sharded tables: Logs_2026, Logs_2026_09, Logs_202609, Logs_y2026m09 (the
+# PostgreSQL docs' naming), Logs_2026_09_15, Logs_p20260915
+SHARD_SUFFIX = re.compile(
+    r"^(?P<base>.*[A-Za-z0-9])_[pPyY]?(?P<year>(?:19|20)\d{2})"
+    r"(?:_?[mM]?(?P<month>0[1-9]|1[0-2])(?:_?[dD]?(?P<day>0[1-9]|[12]\d|3[01]))?)?$"
+)
+
+
+def shard_period(table_name):
+    # "SystemLogs_2026_09" -> ("SystemLogs", "month", start, end), epoch seconds in UTC;
+    # None when the name has no (valid) period suffix
+    match = SHARD_SUFFIX.match(table_name)
+    if match is None:
+        return None
+    year, month, day = match["year"], match["month"], match["day"]
+    try:
+        if day:
+            start = datetime(int(year), int(month), int(day), tzinfo=timezone.utc)
+            granularity = "day"
+            end = start + timedelta(days=1)
+        elif month:
+            start = datetime(int(year), int(month), 1, tzinfo=timezone.utc)
+            granularity = "month"
+            end = start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+        else:
+            start = datetime(int(year), 1, 1, tzinfo=timezone.utc)
+            granularity = "year"
+            end = start.replace(year=start.year + 1)
+    except ValueError:
+        # e.g. Logs_2026_02_30
+        return None
+    return match["base"], granularity, int(start.timestamp()), int(end.timestamp())
+
+
+def column_signature(table):
+    return frozenset((col.name.lower(), col.data_type) for col in table.columns)
+
+
+def collapse_shard_families(catalog):
+    # Tables sharing a base name and a period granularity become one logical table (in the
+    # position of its first-listed shard) when all of them have the same column set. Lone
+    # shards, families whose schema drifted and bases that are already a real table stay as is.
+    families = OrderedDict()
+    for table in catalog:
+        period = shard_period(table.key)
+        if period is None:
+            continue
+        base, granularity, start, end = period
+        families.setdefault((base.lower(), granularity), (base, []))[1].append((start, end, table))
+
+    logical = {}
+    bases = set()
+    for (base_key, _granularity), (base, members) in families.items():
+        if len(members) < 2 or base in catalog or base_key in bases:
+            continue
+        if len({start for start, _end, _table in members}) < len(members):
+            continue
+        if len({column_signature(table) for _start, _end, table in members}) > 1:
+            continue
+        bases.add(base_key)
+        logical[id(members[0][2])] = merge_shards(base, sorted(members, key=lambda member: member[0]))
+        for _start, _end, table in members[1:]:
+            logical[id(table)] = None
+
+    if not logical:
+        return catalog
+    collapsed = SchemaCatalog()
+    for table in catalog:
+        replacement = logical.get(id(table), table)
+        if replacement is not None:
+            collapsed.add(replacement)
+    return collapsed
+
+
+def merge_shards(base, members):
+    # The oldest shard supplies the column order, keys and classification for the whole family
+    template = members[0][2]
+    columns = [Column(col.name, col.data_type, col.flags, col.unit) for col in template.columns]
+    return Table(
+        base,
+        columns,
+        primary_key=template.primary_key,
+        foreign_keys=template.foreign_keys,
+        shards=[Shard(table.name, start, end) for start, end, table in members],
+    )
@@ -0,0 +1,70 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+
+class Tracer:
+    def __init__(self, process_name="SilverVector"):
+        self.process_name = process_name
+        self.events = []
+        self._origin_ns = time.perf_counter_ns()
+        self._pid = os.getpid()
+
+    # Records one complete ("X") event; `category` is the stage the summary groups by
+    @contextmanager
+    def span(self, name, category, **args):
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end_ns = time.perf_counter_ns()
+            self.events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start_ns - self._origin_ns) / 1000, # Trace viewers expect microseconds
+                "dur": (end_ns - start_ns) / 1000,
+                "pid": self._pid,
+                "tid": threading.get_ident(),
+                "args": args,
+            })
+
+    # Total milliseconds per stage, in the order the stages first ran
+    def summary(self):
+        totals = {}
+        for event in sorted(self.events, key=lambda e: e["ts"]):
+            totals[event["cat"]] = totals.get(event["cat"], 0.0) + event["dur"] / 1000
+        return totals
+
+    def format_summary(self, limit=6):
+        stages = sorted(self.summary().items(), key=lambda item: item[1], reverse=True)[:limit]
+        return " · ".join(f"{stage} {ms:.1f}ms" for stage, ms in stages)
+
+    def to_chrome_trace(self):
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": self._pid, "args": {"name": self.process_name}},
+        ]
+        return {"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}
+
+    def export(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+# Drop-in for callers that don't want instrumentation (keeps the hot path free of `if tracer` checks)
+class NullTracer:
+    events = []
+
+    def span(self, name, category, **args):
+        return nullcontext()
+
+    def summary(self):
+        return {}
+
+    def format_summary(self, limit=6):
+        return ""
+
+
+NULL_TRACER = NullTracer()
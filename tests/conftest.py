@@ -0,0 +1,18 @@
+import os
+
+import pytest
+
+from silvervector.parser import SilverVectorParser
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "src", "silvervector", "examples")
+
+
+@pytest.fixture(scope="session")
+def ecommerce_ddl():
+    with open(os.path.join(EXAMPLES_DIR, "ecommerce.sql")) as f:
+        return f.read()
+
+
+@pytest.fixture
+def ecommerce_tables(ecommerce_ddl):
+    return SilverVectorParser(ecommerce_ddl).parse()
@@ -0,0 +1,45 @@
+from silvervector.catalog import CATEGORICAL, METRIC, TIME, Column, SchemaCatalog, Table
+from silvervector.parser import ColumnModel, SilverVectorParser
+
+DDL = """
+CREATE TABLE [dbo].[Orders] (
+    order_id INT PRIMARY KEY,
+    customer_id INT,
+    total_amount DECIMAL(10, 2),
+    order_status VARCHAR(20),
+    created_at DATETIME
+);
+CREATE TABLE Customers (customer_id INT PRIMARY KEY, region VARCHAR(50), signup_date TIMESTAMP);
+"""
+
+
+def test_parse_returns_indexed_catalog():
+    catalog = SilverVectorParser(DDL).parse()
+
+    assert isinstance(catalog, SchemaCatalog)
+    assert len(catalog) == 2
+
+    orders = catalog.table("orders")
+    assert orders is catalog.table("[Orders]")
+    assert orders.time_col.name == "created_at"
+    assert [c.name for c in orders.metrics] == ["total_amount"]
+    assert [c.name for c in orders.categoricals] == ["order_status"]
+    assert orders.column("TOTAL_AMOUNT").unit == "currencyMYR"
+
+    assert [c.table.name for c in catalog.columns_named("customer_id")] == [orders.name, "Customers"]
+    assert {c.name for c in catalog.columns_with_role(TIME)} == {"created_at", "signup_date"}
+
+
+def test_columns_are_slotted_and_round_trip_to_model():
+    col = Column("latency_ms", "int", METRIC, "ms")
+    Table("Logs", [col])
+
+    assert not hasattr(col, "__dict__")
+    assert col.is_metric and not col.is_categorical
+    assert ColumnModel.from_column(col).model_dump() == col.to_dict()
+
+
+def test_legacy_dict_access_still_works():
+    table = Table("Events", [Column("kind", "varchar", CATEGORICAL)])
+    assert table["name"] == "Events"
+    assert [c.name for c in table["columns"]] == ["kind"]
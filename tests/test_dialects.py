@@ -0,0 +1,110 @@
+import pytest
+
+from silvervector.dialects import get_dialect
+from silvervector.generator import DashboardGenerator
+from silvervector.parser import SilverVectorParser
+
+
+def panel_sql(dashboard, title):
+    panel = next(p for p in dashboard["panels"] if p["title"] == title)
+    return panel["targets"][0]["rawSql"]
+
+
+def test_sqlite_is_the_default_dialect(ecommerce_tables):
+    dashboard = DashboardGenerator(ecommerce_tables).generate()
+    sql = panel_sql(dashboard, "OnlineTransactions - amount_myr Trend")
+
+    assert "unixepoch(created_at) BETWEEN $__from/1000 AND $__to/1000" in sql
+    assert dashboard["templating"]["list"][0]["query"] == "frser-sqlite-datasource"
+
+
+def test_postgres_uses_grafana_macros_and_keeps_ddl_quoting(ecommerce_tables):
+    dashboard = DashboardGenerator(ecommerce_tables, dialect="postgres").generate()
+    sql = panel_sql(dashboard, "OnlineTransactions - amount_myr Trend")
+
+    # Created unquoted, so Postgres stored it folded: quoting it here would miss the relation
+    assert sql == (
+        "SELECT $__timeGroup(created_at, '1h') as time, SUM(amount_myr) as value "
+        "FROM OnlineTransactions WHERE $__timeFilter(created_at) GROUP BY 1 ORDER BY 1"
+    )
+    assert "unixepoch" not in str(dashboard)
+    assert dashboard["templating"]["list"][0]["query"] == "grafana-postgresql-datasource"
+    target = dashboard["panels"][0]["targets"][0]
+    assert target["rawQuery"] and target["editorMode"] == "code"
+
+
+def test_postgres_quotes_only_names_quoted_in_the_ddl():
+    postgres = get_dialect("postgres")
+    assert postgres.identifier("userId") == "userId"
+    assert postgres.identifier('"userId"') == '"userId"'
+    assert postgres.identifier("[OnlineTransactions]") == '"OnlineTransactions"'
+    assert postgres.identifier('"orders"') == "orders"
+    assert postgres.identifier("[Order Lines]") == '"Order Lines"'
+
+    tables = SilverVectorParser(
+        'CREATE TABLE "Orders" ("createdAt" TIMESTAMP, totalAmount INT, status VARCHAR(10));'
+    ).parse()
+    sql = panel_sql(DashboardGenerator(tables, dialect="postgres").generate(), '"Orders" - totalAmount Trend')
+    assert 'SUM(totalAmount) as value FROM "Orders" WHERE $__timeFilter("createdAt")' in sql
+
+
+def test_mysql_uses_backticks_only_when_needed():
+    mysql = get_dialect("mysql")
+    assert mysql.identifier("OnlineTransactions") == "OnlineTransactions"
+    assert mysql.identifier("[Order Lines]") == "`Order Lines`"
+    assert mysql.time_group("created_at", 86400) == "$__timeGroup(created_at, '1d')"
+
+
+def test_timescale_reads_trends_from_continuous_aggregate(ecommerce_tables):
+    dashboard = DashboardGenerator(
+        ecommerce_tables,
+        dialect="timescaledb",
+        continuous_aggregates={"SystemLogs": {"view": "system_logs_hourly", "time_column": "bucket"}},
+    ).generate()
+
+    assert panel_sql(dashboard, "SystemLogs - latency_ms Trend") == (
+        "SELECT time_bucket('3600 seconds', bucket) as time, SUM(latency_ms) as value "
+        "FROM system_logs_hourly WHERE $__timeFilter(bucket) GROUP BY 1 ORDER BY 1"
+    )
+    assert "time_bucket('3600 seconds', created_at)" in panel_sql(dashboard, "OnlineTransactions - amount_myr Trend")
+
+
+def test_timescale_quotes_schema_qualified_aggregates_per_part(ecommerce_tables):
+    dashboard = DashboardGenerator(
+        ecommerce_tables,
+        dialect="timescaledb",
+        continuous_aggregates={"SystemLogs": 'analytics."SystemLogs_Hourly"', "OnlineTransactions": "metrics.tx_hourly"},
+    ).generate()
+
+    assert 'FROM analytics."SystemLogs_Hourly" WHERE' in panel_sql(dashboard, "SystemLogs - latency_ms Trend")
+    assert "FROM metrics.tx_hourly WHERE" in panel_sql(dashboard, "OnlineTransactions - amount_myr Trend")
+
+
+def test_unknown_dialect_is_rejected():
+    with pytest.raises(ValueError):
+        get_dialect("oracle")
+    with pytest.raises(ValueError):
+        get_dialect("postgres", continuous_aggregates={"t": "v"})
+
+
+def test_row_estimates_read_engine_statistics():
+    assert get_dialect("sqlite").row_estimate("SystemLogs") == "SELECT MAX(rowid) as value FROM SystemLogs"
+    assert get_dialect("postgres").row_estimate("SystemLogs") == (
+        "SELECT GREATEST(reltuples, 0)::bigint as value FROM pg_class WHERE oid = 'SystemLogs'::regclass"
+    )
+    assert "TABLE_NAME = 'Order Lines'" in get_dialect("mysql").row_estimate("[Order Lines]")
+    assert get_dialect("timescaledb").row_estimate("metrics") == (
+        "SELECT approximate_row_count('metrics'::regclass) as value"
+    )
+
+
+def test_row_estimate_regclass_matches_how_the_table_was_created():
+    tables = SilverVectorParser(
+        "CREATE TABLE OnlineTransactions (id INT, created_at TIMESTAMP);\n"
+        'CREATE TABLE "AuditLog" (id INT, created_at TIMESTAMP);'
+    ).parse()
+    for dialect in ("postgres", "timescaledb"):
+        dashboard = DashboardGenerator(tables, dialect=dialect, row_counts="estimate").generate()
+        # Unquoted DDL: Postgres stored onlinetransactions, which the bare literal resolves to
+        assert "'OnlineTransactions'::regclass" in panel_sql(dashboard, "OnlineTransactions - Total Records (estimated)")
+        assert "'\"AuditLog\"'::regclass" in panel_sql(dashboard, '"AuditLog" - Total Records (estimated)')
@@ -0,0 +1,58 @@
+import sqlite3
+
+import pytest
+
+from silvervector.generator import DashboardGenerator
+from silvervector.parser import SilverVectorParser
+
+
+def generate(ddl, **options):
+    return DashboardGenerator(SilverVectorParser(ddl).parse(), **options).generate()
+
+
+def test_ecommerce_panels_are_laid_out_on_24_column_grid(ecommerce_ddl):
+    dashboard = generate(ecommerce_ddl)
+    panels = dashboard["panels"]
+
+    titles = [p["title"] for p in panels]
+    assert "Total Revenue (amount_myr)" in titles
+    assert "SystemLogs - latency_ms Trend" in titles
+    assert len({p["id"] for p in panels}) == len(panels)
+    for panel in panels:
+        assert panel["gridPos"]["x"] in (0, 12)
+        assert panel["gridPos"]["w"] == 12
+
+
+def test_tables_without_time_column_are_skipped():
+    dashboard = generate("CREATE TABLE Lookup (code VARCHAR(10), amount INT);")
+    assert dashboard["panels"] == []
+
+
+def test_row_count_modes_replace_full_table_counts(ecommerce_ddl):
+    exact = {p["title"]: p for p in generate(ecommerce_ddl)["panels"]}
+    assert exact["SystemLogs - Total Records"]["targets"][0]["rawSql"] == "SELECT count(*) as value FROM SystemLogs"
+
+    estimated = {p["title"]: p for p in generate(ecommerce_ddl, row_counts="estimate")["panels"]}
+    assert "SystemLogs - Total Records" not in estimated
+    assert estimated["SystemLogs - Total Records (estimated)"]["targets"][0]["rawSql"] == (
+        "SELECT MAX(rowid) as value FROM SystemLogs"
+    )
+
+    windowed = {p["title"]: p for p in generate(ecommerce_ddl, row_counts="window")["panels"]}
+    assert windowed["SystemLogs - Total Records (in range)"]["targets"][0]["rawSql"] == (
+        "SELECT count(*) as value FROM SystemLogs WHERE unixepoch(log_time) BETWEEN $__from/1000 AND $__to/1000"
+    )
+
+    with pytest.raises(ValueError):
+        generate(ecommerce_ddl, row_counts="sampled")
+
+
+def test_sqlite_row_estimate_runs_without_a_scan(ecommerce_ddl):
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE SystemLogs (log_id INTEGER PRIMARY KEY, latency_ms INT, log_time TIMESTAMP)")
+    conn.executemany("INSERT INTO SystemLogs (latency_ms, log_time) VALUES (?, datetime('now'))", [(i,) for i in range(50)])
+
+    sql = generate(ecommerce_ddl, row_counts="estimate")["panels"]
+    sql = next(p for p in sql if p["title"] == "SystemLogs - Total Records (estimated)")["targets"][0]["rawSql"]
+    assert conn.execute(sql).fetchone()[0] == 50
+    assert "SCAN" not in " ".join(row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + sql))
@@ -0,0 +1,72 @@
+from silvervector.catalog import LABEL, METRIC, TIME, Column, SchemaCatalog, Table
+from silvervector.generator import DashboardGenerator
+from silvervector.joins import build_join_graph
+from silvervector.parser import SilverVectorParser
+
+
+def test_declared_foreign_key_becomes_cheapest_edge(ecommerce_tables):
+    graph = build_join_graph(ecommerce_tables)
+    edge = graph.edges[0]
+
+    assert edge.describe() == "OnlineTransactions.customer_id → RegisteredCustomers.customer_id"
+    assert edge.source == "foreign_key"
+    assert graph.neighbors("RegisteredCustomers") == [edge]
+
+
+def test_name_matched_candidates_are_ranked_after_declared_keys():
+    ddl = """
+    CREATE TABLE users (id INT PRIMARY KEY, country VARCHAR(50));
+    CREATE TABLE stores (store_id INT PRIMARY KEY, region VARCHAR(50));
+    CREATE TABLE sales (sale_id INT PRIMARY KEY, user_id INT, store_id INT, amount DECIMAL(10,2), sold_at TIMESTAMP);
+    """
+    graph = build_join_graph(SilverVectorParser(ddl).parse())
+
+    assert [(e.describe(), e.source) for e in graph] == [
+        ("sales.store_id → stores.store_id", "shared_key"),
+        ("sales.user_id → users.id", "name_stem"),
+    ]
+
+
+def test_words_ending_in_id_are_not_keys():
+    ddl = """
+    CREATE TABLE vals (id INT PRIMARY KEY, label VARCHAR(20));
+    CREATE TABLE gr (id INT PRIMARY KEY, label VARCHAR(20));
+    CREATE TABLE users (id INT PRIMARY KEY, country VARCHAR(50));
+    CREATE TABLE pay (pay_pk INT PRIMARY KEY, valid INT, grid INT, userId INT, amount INT, paid_at TIMESTAMP);
+    """
+    graph = build_join_graph(SilverVectorParser(ddl).parse())
+
+    assert [(e.describe(), e.source) for e in graph] == [("pay.userId → users.id", "name_stem")]
+
+
+def test_joined_panels_group_fact_metric_by_dimension(ecommerce_tables):
+    dashboard = DashboardGenerator(ecommerce_tables, suggest_joins=True).generate()
+    panel = dashboard["panels"][-1]
+
+    assert panel["title"] == "OnlineTransactions - amount_myr by region"
+    assert panel["targets"][0]["rawSql"].startswith(
+        "SELECT dim.region, SUM(f.amount_myr) as value FROM OnlineTransactions f "
+        "JOIN RegisteredCustomers dim ON f.customer_id = dim.customer_id"
+    )
+
+
+def test_graph_build_scales_to_thousands_of_tables(monkeypatch):
+    tables = [Table("dim_region", [Column("region_id", "int", LABEL), Column("region", "varchar", LABEL)], primary_key=["region_id"])]
+    for i in range(5000):
+        tables.append(Table(f"fact_{i}", [
+            Column(f"fact_{i}_pk", "int", LABEL),
+            Column("region_id", "int", LABEL),
+            Column("amount", "int", METRIC),
+            Column("created_at", "timestamp", TIME),
+        ], primary_key=[f"fact_{i}_pk"]))
+
+    probes = []
+    is_primary_key = Table.is_primary_key
+    monkeypatch.setattr(Table, "is_primary_key", lambda self, name: probes.append(name) or is_primary_key(self, name))
+
+    graph = build_join_graph(SchemaCatalog(tables))
+    assert len(graph) == 5000
+    assert {edge.dimension.name for edge in graph} == {"dim_region"}
+    # Linear in columns: a pairwise table comparison would probe ~25M keys, not ~40k
+    total_columns = sum(len(table.columns) for table in tables)
+    assert len(probes) <= 2 * total_columns
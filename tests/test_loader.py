@@ -0,0 +1,107 @@
+import gzip
+
+import pytest
+
+from silvervector import loader
+from silvervector.loader import extract_ddl
+from silvervector.parser import SilverVectorParser
+
+PG_DUMP = """--
+-- PostgreSQL database dump
+--
+SET statement_timeout = 0;
+
+CREATE TABLE public.orders (
+    order_id integer NOT NULL,
+    customer_id integer,
+    amount numeric(10,2),
+    created_at timestamp without time zone
+);
+
+ALTER TABLE public.orders OWNER TO app;
+
+COPY public.orders (order_id, customer_id, amount, created_at) FROM stdin;
+1\t10\t9.99\t2026-09-01 10:00:00
+CREATE TABLE not_a_table (this_is data);
+2\t11\t19.99\t2026-09-02 11:00:00
+\\.
+
+CREATE TABLE public.customers (
+    customer_id integer NOT NULL,
+    region character varying(50)
+);
+
+ALTER TABLE ONLY public.orders
+    ADD CONSTRAINT orders_customer_fk FOREIGN KEY (customer_id) REFERENCES public.customers(customer_id);
+"""
+
+SQLITE_DUMP = """PRAGMA foreign_keys=OFF;
+BEGIN TRANSACTION;
+CREATE TABLE SystemLogs (log_id INTEGER PRIMARY KEY, latency_ms INT, log_time TIMESTAMP);
+INSERT INTO SystemLogs VALUES(1,120,'2026-09-01');
+INSERT INTO SystemLogs VALUES(2,80,'it''s;
+CREATE TABLE fake (x INT);');
+INSERT INTO SystemLogs VALUES(3,95,'2026-09-03');
+CREATE TABLE Events (event_id INTEGER PRIMARY KEY, event_type TEXT, created_at DATETIME);
+COMMIT;
+"""
+
+MYSQL_DUMP = """-- MySQL dump 10.13  Distrib 8.0.36, for Linux (x86_64)
+--
+-- Host: localhost    Database: shop
+-- ------------------------------------------------------
+CREATE TABLE `a` (`id` int NOT NULL, `note` varchar(50), PRIMARY KEY (`id`));
+INSERT INTO `a` VALUES (1,'it\\'s'),(2,'back\\\\');
+CREATE TABLE `b` (`id` int NOT NULL, `created_at` datetime);
+CREATE TABLE `c` (`id` int NOT NULL, `amount` decimal(10,2));
+"""
+
+
+def write(tmp_path, name, text, compress=False):
+    path = tmp_path / name
+    data = text.encode("utf-8")
+    path.write_bytes(gzip.compress(data) if compress else data)
+    return str(path)
+
+
+def test_pg_dump_skips_copy_data_and_keeps_foreign_keys(tmp_path):
+    ddl = extract_ddl(write(tmp_path, "dump.sql", PG_DUMP))
+
+    assert ddl.count("CREATE TABLE") == 2
+    assert "not_a_table" not in ddl
+    assert "OWNER TO" not in ddl
+    assert "FOREIGN KEY (customer_id)" in ddl
+
+
+def test_sqlite_dump_skips_insert_runs(tmp_path):
+    ddl = extract_ddl(write(tmp_path, "dump.sql", SQLITE_DUMP))
+
+    assert "INSERT" not in ddl
+    assert "fake" not in ddl
+    tables = SilverVectorParser(ddl).parse()
+    assert [t.name for t in tables] == ["SystemLogs", "Events"]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_mysql_dump_backslash_escaped_quotes_keep_later_tables(tmp_path, compress):
+    ddl = extract_ddl(write(tmp_path, "dump.sql", MYSQL_DUMP, compress=compress))
+
+    assert "INSERT" not in ddl
+    assert [t.key for t in SilverVectorParser(ddl).parse()] == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize("chunk_bytes", [7, 64, 1 << 20])
+def test_gzip_stream_matches_plain_file_across_chunk_boundaries(tmp_path, monkeypatch, chunk_bytes):
+    monkeypatch.setattr(loader, "GZIP_CHUNK_BYTES", chunk_bytes)
+    plain = extract_ddl(write(tmp_path, "dump.sql", PG_DUMP + SQLITE_DUMP))
+    packed = extract_ddl(write(tmp_path, "dump.sql.gz", PG_DUMP + SQLITE_DUMP, compress=True))
+
+    assert packed == plain
+
+
+def test_progress_reports_bytes_scanned(tmp_path):
+    path = write(tmp_path, "dump.sql", PG_DUMP)
+    calls = []
+    extract_ddl(path, progress=lambda done, total: calls.append((done, total)))
+
+    assert calls[-1] == (len(PG_DUMP.encode()), len(PG_DUMP.encode()))
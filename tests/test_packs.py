@@ -0,0 +1,78 @@
+from silvervector.generator import DashboardGenerator
+from silvervector.packs import PackRegistry, PanelPack, default_registry
+from silvervector.parser import SilverVectorParser
+
+ORCHARD_DDL = """
+CREATE TABLE [ContentItemIndex] (Id INTEGER PRIMARY KEY, ContentType TEXT, Published INTEGER, PublishedUtc DATETIME, ModifiedUtc DATETIME, DisplayText TEXT, Author TEXT);
+CREATE TABLE [UserIndex] (Id INTEGER PRIMARY KEY, NormalizedUserName TEXT);
+"""
+
+WORDPRESS_DDL = """
+CREATE TABLE wp_users (ID BIGINT PRIMARY KEY, user_login VARCHAR(60), user_registered DATETIME);
+CREATE TABLE wp_posts (ID BIGINT PRIMARY KEY, post_date DATETIME, post_status VARCHAR(20), post_type VARCHAR(20));
+CREATE TABLE wp_comments (comment_ID BIGINT PRIMARY KEY, comment_date DATETIME, comment_approved VARCHAR(20));
+"""
+
+
+def test_builtin_packs_are_detected_by_signature():
+    registry = default_registry()
+
+    assert [p.name for p in registry.match(SilverVectorParser(ORCHARD_DDL).parse())] == ["Orchard Core"]
+    assert [p.name for p in registry.match(SilverVectorParser(WORDPRESS_DDL).parse())] == ["WordPress"]
+
+
+def test_tables_repeated_across_schemas_still_match():
+    ddl = """
+    CREATE TABLE dbo.ContentItemIndex (Id INTEGER PRIMARY KEY, ContentType TEXT, PublishedUtc DATETIME);
+    CREATE TABLE tenant2.ContentItemIndex (Id INTEGER PRIMARY KEY, ContentType TEXT, PublishedUtc DATETIME);
+    """
+    tables = SilverVectorParser(ddl).parse()
+    assert len(tables) == 2
+    assert [p.name for p in default_registry().match(tables)] == ["Orchard Core"]
+
+
+def test_column_signature_must_match_fully():
+    partial = WORDPRESS_DDL.replace("comment_approved", "comment_karma")
+    assert default_registry().match(SilverVectorParser(partial).parse()) == []
+
+
+def test_orchard_pack_contributes_panels_through_generator():
+    dashboard = DashboardGenerator(SilverVectorParser(ORCHARD_DDL).parse()).generate()
+    titles = [p["title"] for p in dashboard["panels"]]
+
+    assert titles[0] == "Total Users"
+    assert "Content Velocity (Items/Day)" in titles
+    assert len({p["id"] for p in dashboard["panels"]}) == len(titles)
+
+    without_packs = DashboardGenerator(SilverVectorParser(ORCHARD_DDL).parse(), packs=False).generate()
+    assert "Content Velocity (Items/Day)" not in [p["title"] for p in without_packs["panels"]]
+
+
+def test_custom_pack_registry_scales_with_schema_not_pack_count():
+    class Generated(PanelPack):
+        def __init__(self, i):
+            self.name = f"pack {i}"
+            self.tables = (f"app_{i}_items",)
+
+        def contribute(self, gen):
+            gen.add_stat_panel(self.name, "SELECT 1 as value")
+
+    registry = PackRegistry(Generated(i) for i in range(2000))
+    catalog = SilverVectorParser("CREATE TABLE app_1234_items (id INT);").parse()
+
+    matched = registry.match(catalog)
+    assert [p.name for p in matched] == ["pack 1234"]
+    dashboard = DashboardGenerator(catalog, packs=registry).generate()
+    assert [p["title"] for p in dashboard["panels"]] == ["pack 1234"]
+
+
+def test_orchard_pack_follows_ddl_quoting_on_postgres():
+    ddl = ('CREATE TABLE "ContentItemIndex" ("Id" INT, "ContentType" TEXT, "Published" BOOLEAN, '
+           '"PublishedUtc" TIMESTAMP, "ModifiedUtc" TIMESTAMP, "DisplayText" TEXT, "Author" TEXT);')
+    dashboard = DashboardGenerator(SilverVectorParser(ddl).parse(), dialect="postgres").generate()
+    velocity = next(p for p in dashboard["panels"] if p["title"] == "Content Velocity (Items/Day)")
+
+    assert velocity["targets"][0]["rawSql"] == (
+        "SELECT $__timeGroup(\"PublishedUtc\", '1d') as time, count(*) as value "
+        'FROM "ContentItemIndex" WHERE "Published" = 1 AND $__timeFilter("PublishedUtc") GROUP BY 1 ORDER BY 1'
+    )
@@ -0,0 +1,65 @@
+import pytest
+from simple_ddl_parser import DDLParser
+
+from silvervector.parser import SilverVectorParser, fast_parse_statement, split_statements
+from silvervector.tracing import Tracer
+
+# Differential corpus: the fast path must give exactly DDLParser's tables, whether it
+# handles a statement itself or hands it over
+FAST_PATH_CORPUS = [
+    "CREATE TABLE a (x INT, y TEXT)",
+    "CREATE TABLE a (x INT NOT NULL, y VARCHAR(10) NULL DEFAULT 'abc', z INT DEFAULT 0, "
+    "w TIMESTAMP DEFAULT CURRENT_TIMESTAMP, u INT UNIQUE, v REAL DEFAULT -1.5, d INT DEFAULT 007);",
+    "CREATE TABLE a (x INTEGER PRIMARY KEY AUTOINCREMENT, amount DECIMAL(10, 2), code CHAR(3));",
+    "CREATE TABLE a (x INT, y INT, PRIMARY KEY (x, y));",
+    "CREATE TABLE [dbo].[Orders] ([Id] INT PRIMARY KEY, \"userId\" INT, `score` int);",
+    "CREATE TABLE IF NOT EXISTS public.events (id bigint primary key, date DATE, time TIME, text TEXT);",
+    "CREATE TABLE t (\n  customer_id INT REFERENCES Customers(customer_id),\n  order_id INT,\n"
+    "  FOREIGN KEY (order_id) REFERENCES Orders(order_id)\n);",
+    "CREATE TABLE t (\n  id INT, -- first\n  status VARCHAR(20), -- a, b (c)\n  note TEXT -- 500 = Error\n  , region TEXT -- x -- y\n);",
+    "-- header\nCREATE TABLE a (x INT);\n\n-- between\nCREATE TABLE b (y INT); -- after\n",
+]
+
+FALLBACK_CORPUS = [
+    "CREATE TABLE a (x INT REFERENCES s.c(cid) NOT NULL, y INT REFERENCES d)",
+    "CREATE TABLE a (x INT CHECK (x > 0), y VARCHAR(MAX), z TIMESTAMP WITH TIME ZONE);",
+    "CREATE TABLE a (x INT PRIMARY KEY, y INT, PRIMARY KEY (y));",
+    "CREATE TABLE a (type INT, key TEXT, comment TEXT);",
+    "CREATE TABLE a (x INT NULL NOT NULL);",
+    "CREATE TABLE a (x TEXT DEFAULT 'it''s', y TEXT DEFAULT '--'); -- 'q' -- 'r'",
+    "CREATE TABLE a (x INT, -- café\n y INT);",
+    "CREATE TABLE a (x INT);\nALTER TABLE a ADD FOREIGN KEY (x) REFERENCES b(id);",
+    "CREATE TABLE a (x INT) ENGINE=InnoDB DEFAULT CHARSET=utf8;\nCREATE TABLE b (y INT);",
+    "/* block */\nCREATE TABLE a (x INT);",
+    "CREATE TABLE a (x INT)\nCREATE TABLE b (y INT);",
+    "CREATE TABLE a (x INT); CREATE TABLE b (y INT);",
+    "CREATE TABLE a (x INT);\r\nCREATE TABLE b (y INT);\r\n",
+]
+
+
+@pytest.mark.parametrize("ddl", FAST_PATH_CORPUS + FALLBACK_CORPUS)
+def test_fast_path_matches_ddl_parser(ddl):
+    expected = DDLParser(ddl).run(group_by_type=True)["tables"]
+    assert SilverVectorParser(ddl)._raw_tables() == expected
+
+
+@pytest.mark.parametrize("ddl", FAST_PATH_CORPUS)
+def test_plain_statements_skip_ddl_parser(ddl):
+    assert all(fast_parse_statement(s) is not None for s in split_statements(ddl))
+
+
+def test_examples_take_the_fast_path(ecommerce_ddl):
+    statements = split_statements(ecommerce_ddl)
+    assert len(statements) == 3
+    assert all(fast_parse_statement(s) is not None for s in statements)
+
+    tracer = Tracer()
+    tables = SilverVectorParser(ecommerce_ddl, tracer=tracer).parse()
+    assert "DDLParser.run" not in [e["name"] for e in tracer.events]
+    assert tables.table("OnlineTransactions").foreign_keys[0].ref_table == "RegisteredCustomers"
+    assert tables.table("RegisteredCustomers").column("region").unit == "short"
+
+
+def test_mixed_statements_keep_order():
+    ddl = "CREATE TABLE a (x INT);\nCREATE TABLE b (y INT CHECK (y > 0));\nCREATE TABLE c (z INT);"
+    assert [t.name for t in SilverVectorParser(ddl).parse()] == ["a", "b", "c"]
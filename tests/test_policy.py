@@ -0,0 +1,92 @@
+import sqlite3
+import time
+
+import pytest
+
+from silvervector.generator import DashboardGenerator
+from silvervector.policy import cheapest_refresh
+
+
+def panels_by_title(dashboard):
+    return {p["title"]: p for p in dashboard["panels"]}
+
+
+def test_policies_follow_query_kind(ecommerce_tables):
+    dashboard = DashboardGenerator(ecommerce_tables).generate()
+    panels = panels_by_title(dashboard)
+
+    trend = panels["SystemLogs - latency_ms Trend"]
+    assert trend["cacheTimeout"] == "1m"
+    assert trend["maxDataPoints"] == 1000
+    assert trend["interval"] == "1h"
+    assert panels["SystemLogs - Total Records"]["cacheTimeout"] == "1h"
+    assert panels["Total Revenue (amount_myr)"]["cacheTimeout"] == "5m"
+    assert panels["OnlineTransactions - payment_status Distribution"]["queryCachingTTL"] == 900_000
+
+    # Live trends need a minute at most; nothing needs the old 10s refresh
+    assert dashboard["refresh"] == "1m"
+
+
+def test_policies_can_be_disabled(ecommerce_tables):
+    dashboard = DashboardGenerator(ecommerce_tables, query_policies=False).generate()
+    assert dashboard["refresh"] == "10s"
+    assert all("cacheTimeout" not in p for p in dashboard["panels"])
+
+
+def test_sample_database_growth_slows_idle_tables(tmp_path, ecommerce_ddl, ecommerce_tables):
+    db_path = tmp_path / "sample.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(ecommerce_ddl.replace("DECIMAL(10, 2)", "REAL"))
+    now = int(time.time())
+    # Transactions keep arriving (one a minute); logs stopped a week ago
+    conn.executemany(
+        "INSERT INTO OnlineTransactions VALUES (?, 1, 10.0, 'Success', datetime(?, 'unixepoch'))",
+        [(i, now - i * 60) for i in range(1, 1441)],
+    )
+    conn.execute("INSERT INTO SystemLogs VALUES (1, '/', 200, 12, NULL, datetime(?, 'unixepoch'))", (now - 7 * 86400,))
+    conn.commit()
+    conn.close()
+
+    dashboard = DashboardGenerator(ecommerce_tables, sample_db=str(db_path)).generate()
+    panels = panels_by_title(dashboard)
+
+    assert panels["SystemLogs - latency_ms Trend"]["cacheTimeout"] == "1d"
+    assert panels["OnlineTransactions - amount_myr Trend"]["cacheTimeout"] == "1m"
+    assert dashboard["refresh"] == "1m"
+
+
+def test_old_sample_database_is_measured_at_its_own_snapshot_time(tmp_path, ecommerce_ddl, ecommerce_tables):
+    db_path = tmp_path / "sample.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(ecommerce_ddl.replace("DECIMAL(10, 2)", "REAL"))
+    # Copied three days ago while both tables received a row a minute
+    taken = int(time.time()) - 3 * 86400
+    conn.executemany(
+        "INSERT INTO OnlineTransactions VALUES (?, 1, 10.0, 'Success', datetime(?, 'unixepoch'))",
+        [(i, taken - i * 60) for i in range(1, 1441)],
+    )
+    conn.executemany(
+        "INSERT INTO SystemLogs VALUES (?, '/', 200, 12, NULL, datetime(?, 'unixepoch'))",
+        [(i, taken - i * 60) for i in range(1, 1441)],
+    )
+    conn.commit()
+    conn.close()
+
+    dashboard = DashboardGenerator(ecommerce_tables, sample_db=str(db_path)).generate()
+    panels = panels_by_title(dashboard)
+
+    assert panels["SystemLogs - latency_ms Trend"]["cacheTimeout"] == "1m"
+    assert panels["OnlineTransactions - amount_myr Trend"]["cacheTimeout"] == "1m"
+    assert dashboard["refresh"] == "1m"
+
+
+def test_sample_database_requires_sqlite_dialect(ecommerce_tables):
+    with pytest.raises(ValueError):
+        DashboardGenerator(ecommerce_tables, dialect="postgres", sample_db="x.db")
+
+
+def test_cheapest_refresh_never_exceeds_freshest_panel():
+    assert cheapest_refresh(5) == "10s"
+    assert cheapest_refresh(60) == "1m"
+    assert cheapest_refresh(899) == "5m"
+    assert cheapest_refresh(86400) == "1d"
@@ -0,0 +1,108 @@
+import json
+import os
+import stat
+
+import pytest
+
+from silvervector.provisioning import (
+    MANIFEST_NAME,
+    PROVIDER_PATH,
+    ProvisionedDashboard,
+    build_from_schema_dir,
+    export_provisioning,
+)
+
+
+def make_items(count=3, version=1):
+    return [
+        ProvisionedDashboard("Shop", f"db{i}", {"panels": [{"id": 1, "title": f"v{version}"}], "refresh": "1m"})
+        for i in range(count)
+    ]
+
+
+def test_export_writes_provider_dashboards_and_manifest(tmp_path):
+    report = export_provisioning(make_items(), tmp_path)
+
+    assert len(report.written) == 4  # provider + 3 dashboards
+    provider = (tmp_path / PROVIDER_PATH).read_text()
+    assert "foldersFromFilesStructure: true" in provider
+    assert str(tmp_path / "dashboards") in provider
+
+    dashboard = json.loads((tmp_path / "dashboards" / "Shop" / "db0.json").read_text())
+    assert dashboard["title"] == "db0"
+    assert dashboard["uid"] and len(dashboard["uid"]) <= 40
+
+    manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+    assert set(manifest["files"]) == set(report.written)
+    # No temp files left behind for Grafana to trip over
+    assert not [n for n in os.listdir(tmp_path / "dashboards" / "Shop") if not n.endswith(".json")]
+
+
+def test_unchanged_dashboards_are_not_rewritten(tmp_path):
+    export_provisioning(make_items(), tmp_path)
+    target = tmp_path / "dashboards" / "Shop" / "db1.json"
+    mtime = target.stat().st_mtime_ns
+
+    items = make_items()
+    items[0] = ProvisionedDashboard("Shop", "db0", {"panels": [{"id": 1, "title": "v2"}], "refresh": "1m"})
+    report = export_provisioning(items, tmp_path)
+
+    assert report.written == ["dashboards/Shop/db0.json"]
+    assert len(report.unchanged) == 3
+    assert target.stat().st_mtime_ns == mtime
+
+
+def test_removed_dashboards_are_pruned(tmp_path):
+    export_provisioning(make_items(3), tmp_path)
+    report = export_provisioning(make_items(2), tmp_path)
+
+    assert report.removed == ["dashboards/Shop/db2.json"]
+    assert not (tmp_path / "dashboards" / "Shop" / "db2.json").exists()
+
+
+def test_duplicate_names_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        export_provisioning(make_items(1) + make_items(1), tmp_path)
+
+
+def test_general_dashboards_sit_at_the_root_and_emptied_folders_go(tmp_path):
+    export_provisioning([ProvisionedDashboard(None, "overview", {}), ProvisionedDashboard("Ops", "logs", {})], tmp_path)
+    assert (tmp_path / "dashboards" / "overview.json").exists()
+    assert not (tmp_path / "dashboards" / "General").exists()
+
+    report = export_provisioning([ProvisionedDashboard(None, "overview", {})], tmp_path)
+    assert report.removed == ["dashboards/Ops/logs.json"]
+    assert not (tmp_path / "dashboards" / "Ops").exists()
+
+
+def test_build_from_schema_dir_uses_folders(tmp_path):
+    (tmp_path / "billing" / "sub").mkdir(parents=True)
+    (tmp_path / "billing" / "ledger.sql").write_text(
+        "CREATE TABLE Ledger (entry_id INT PRIMARY KEY, amount_myr DECIMAL(10,2), created_at TIMESTAMP);"
+    )
+    (tmp_path / "billing" / "sub" / "refunds.sql").write_text(
+        "CREATE TABLE Refunds (refund_id INT PRIMARY KEY, amount_myr DECIMAL(10,2), created_at TIMESTAMP);"
+    )
+    (tmp_path / "logs.sql").write_text("CREATE TABLE SystemLogs (log_id INT PRIMARY KEY, log_time TIMESTAMP);")
+
+    items = build_from_schema_dir(str(tmp_path), workers=1)
+
+    assert sorted((i.folder, i.name) for i in items) == [
+        ("General", "logs"), ("billing", "ledger"), ("billing - sub", "refunds"),
+    ]
+    assert all(i.dashboard["panels"] for i in items)
+    # The directory Grafana turns into a folder carries the same title the API publisher uses
+    assert sorted(i.relative_path for i in items) == [
+        "dashboards/billing - sub/refunds.json", "dashboards/billing/ledger.json", "dashboards/logs.json",
+    ]
+
+
+def test_exported_files_are_readable_by_other_users(tmp_path):
+    umask = os.umask(0o022)
+    try:
+        export_provisioning(make_items(1), tmp_path)
+    finally:
+        os.umask(umask)
+
+    for path in (tmp_path / PROVIDER_PATH, tmp_path / "dashboards" / "Shop" / "db0.json", tmp_path / MANIFEST_NAME):
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
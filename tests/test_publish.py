@@ -0,0 +1,121 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from silvervector.provisioning import ProvisionedDashboard
+from silvervector.publish import GrafanaClient, PublishError, publish_dashboards
+
+
+class MockGrafanaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment, like Grafana does; otherwise Nagle + delayed ACK
+    # stall every keep-alive response by ~40ms
+    wbufsize = -1
+
+    def do_GET(self):
+        grafana = self.server.grafana
+        if self.path.startswith("/api/folders"):
+            with grafana["lock"]:
+                folders = [{"uid": uid, "title": title} for uid, title in grafana["folders"].items()]
+            self._respond(200, folders)
+        else:
+            self._respond(404, {"message": "Not found"})
+
+    def do_POST(self):
+        grafana = self.server.grafana
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with grafana["lock"]:
+            grafana["requests"].append((self.path, self.headers.get("Authorization")))
+            if self.path == "/api/folders":
+                grafana["folders"][payload["uid"]] = payload["title"]
+                return self._respond(200, payload)
+            uid = payload["dashboard"]["uid"]
+            # Fail the first upload of every "flaky" dashboard to exercise retries
+            if payload["dashboard"]["title"].startswith("flaky") and uid not in grafana["flaked"]:
+                grafana["flaked"].add(uid)
+                return self._respond(503, {"message": "busy"}, {"Retry-After": "0"})
+            if payload["dashboard"]["title"] == "broken":
+                return self._respond(400, {"message": "Dashboard title cannot be empty"})
+            grafana["dashboards"][uid] = payload
+        self._respond(200, {"status": "success", "uid": uid})
+
+    def _respond(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def grafana():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), MockGrafanaHandler)
+    httpd.daemon_threads = True
+    httpd.grafana = {"lock": threading.Lock(), "folders": {"ops": "Ops"}, "dashboards": {},
+                     "requests": [], "flaked": set()}
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def make_client(grafana, **options):
+    return GrafanaClient(f"http://127.0.0.1:{grafana.server_address[1]}", token="secret", backoff=0, **options)
+
+
+def test_publish_reuses_pooled_connections_and_creates_missing_folders(grafana):
+    items = [ProvisionedDashboard(folder, f"db{i}", {"panels": []})
+             for i in range(60) for folder in ("Ops", "Shop", None)]
+    client = make_client(grafana, pool_size=4)
+    report = publish_dashboards(items, client, workers=4)
+    client.close()
+
+    assert len(report.published) == 180 and not report.failed
+    # "Ops" already existed and "General" is the root, so only "Shop" is created
+    assert report.folders_created == ["Shop"]
+    assert len(grafana.grafana["dashboards"]) == 180
+    # Keep-alive: at most one connection per pool slot, not one per dashboard
+    assert client.pool.opened <= 4
+
+    saved = grafana.grafana["dashboards"]
+    ops = [d for d in saved.values() if d.get("folderUid") == "ops"]
+    general = [d for d in saved.values() if "folderUid" not in d]
+    assert len(ops) == 60 and len(general) == 60
+    assert all(d["overwrite"] and d["dashboard"]["id"] is None for d in saved.values())
+    assert {auth for _, auth in grafana.grafana["requests"]} == {"Bearer secret"}
+
+
+def test_publish_retries_transient_errors_and_reports_failures(grafana):
+    items = [ProvisionedDashboard(None, "flaky-1", {}), ProvisionedDashboard(None, "broken", {}),
+             ProvisionedDashboard(None, "steady", {})]
+    client = make_client(grafana, retries=2)
+    report = publish_dashboards(items, client)
+    client.close()
+
+    assert sorted(report.published) == ["General/flaky-1", "General/steady"]
+    assert [name for name, _ in report.failed] == ["General/broken"]
+    assert "cannot be empty" in report.failed[0][1]
+
+
+def test_client_gives_up_after_retries(grafana):
+    client = make_client(grafana, retries=0)
+    with pytest.raises(PublishError) as e:
+        client.save_dashboard({"uid": "x", "title": "flaky-2"})
+    assert e.value.status == 503
+
+
+def test_retry_after_is_capped():
+    client = GrafanaClient("http://127.0.0.1:1", backoff=0.5, max_backoff=10)
+    assert client.retry_delay(0, "3600") == 10
+    assert client.retry_delay(1, "2") == 2.0
+    assert client.retry_delay(1, "Wed, 21 Oct 2026 07:28:00 GMT") == 1.0
+    assert client.retry_delay(10) == 10
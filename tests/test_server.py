@@ -0,0 +1,161 @@
+import http.client
+import json
+import os
+import signal
+import threading
+
+import pytest
+
+from silvervector import server as server_module
+from silvervector.server import ResponseCache, create_server
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = create_server(port=0, workers=1, max_concurrent=2, cache_size=8)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+    httpd.service.shutdown()
+
+
+def request(server, method, path, payload=None):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=30)
+    body = json.dumps(payload) if payload is not None else None
+    conn.request(method, path, body=body, headers={"Content-Type": "application/json"})
+    response = conn.getresponse()
+    data = json.loads(response.read())
+    conn.close()
+    return response, data
+
+
+def test_generate_is_cached_by_ddl_and_options(server, ecommerce_ddl):
+    first, dashboard = request(server, "POST", "/generate", {"ddl": ecommerce_ddl})
+    second, cached = request(server, "POST", "/generate", {"ddl": ecommerce_ddl})
+
+    assert first.status == 200 and first.getheader("X-Cache") == "MISS"
+    assert second.status == 200 and second.getheader("X-Cache") == "HIT"
+    assert dashboard == cached
+    assert dashboard["title"] == "SilverVector Generated Dashboard"
+    assert len(dashboard["panels"]) == 8
+
+    _, metrics = request(server, "GET", "/metrics")
+    assert metrics["cache"]["hits"] >= 1
+    assert metrics["endpoints"]["POST /generate"]["count"] >= 2
+
+
+def test_analyze_reports_column_roles(server):
+    ddl = "CREATE TABLE Orders (id INT PRIMARY KEY, total_amount DECIMAL(10,2), created_at TIMESTAMP);"
+    response, result = request(server, "POST", "/analyze", {"ddl": ddl})
+
+    assert response.status == 200
+    columns = {c["name"]: c for c in result["tables"][0]["columns"]}
+    assert columns["total_amount"]["is_metric"]
+    assert columns["created_at"]["is_time_col"]
+
+
+def test_bad_requests_are_rejected(server):
+    response, _ = request(server, "POST", "/generate", {"options": {}})
+    assert response.status == 400
+
+    response, error = request(server, "POST", "/generate", {"ddl": "CREATE TABLE t (a INT);", "options": {"nope": 1}})
+    assert response.status == 400
+    assert "Invalid options" in error["error"]
+
+    response, _ = request(server, "POST", "/missing", {"ddl": "x"})
+    assert response.status == 404
+
+
+@pytest.mark.parametrize("option, value", [("sample_db", "/etc/passwd"), ("packs", []), ("tracer", 1)])
+def test_server_side_generator_options_are_rejected(server, option, value):
+    ddl = "CREATE TABLE t (a INT, created_at TIMESTAMP);"
+    response, error = request(server, "POST", "/generate", {"ddl": ddl, "options": {option: value}})
+    assert response.status == 400
+    assert f"unsupported {option}" in error["error"]
+
+
+def test_unread_bodies_do_not_leak_into_the_next_request(server):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=30)
+    conn.request("POST", "/missing", body=b'{"ddl": "x"}', headers={"Content-Type": "application/json"})
+    response = conn.getresponse()
+    response.read()
+    assert response.status == 404
+    assert response.getheader("Connection") == "close"
+
+    conn.request("GET", "/health")
+    response = conn.getresponse()
+    assert response.status == 200
+    assert json.loads(response.read()) == {"status": "ok"}
+    conn.close()
+
+
+@pytest.mark.parametrize("length", ["abc", "-5"])
+def test_invalid_content_length_is_rejected(server, length):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=30)
+    conn.putrequest("POST", "/generate")
+    conn.putheader("Content-Length", length)
+    conn.endheaders()
+    response = conn.getresponse()
+    assert response.status == 400
+    assert "Content-Length" in json.loads(response.read())["error"]
+    conn.close()
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    cache.get("a")
+    cache.put("c", b"3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.snapshot()["hit_rate"] == pytest.approx(2 / 3, abs=1e-3)
+
+
+def test_warm_up_builds_the_ddl_parser(monkeypatch):
+    runs = []
+    run = server_module.DDLParser.run
+
+    def recording_run(parser, *args, **kwargs):
+        runs.append(parser)
+        return run(parser, *args, **kwargs)
+
+    # Wrap rather than subclass: PLY writes its tables next to the parser class's module
+    monkeypatch.setattr(server_module.DDLParser, "run", recording_run)
+    server_module._warm_worker()
+    assert len(runs) == 1
+
+
+def test_service_recovers_from_a_dead_worker():
+    service = server_module.GenerationService(workers=1, max_concurrent=1, cache_size=0)
+    try:
+        service.warm_up()
+        ddl = b'{"ddl": "CREATE TABLE t (a INT, created_at TIMESTAMP);"}'
+        for process in list(service._pool._processes.values()):
+            os.kill(process.pid, signal.SIGKILL)
+            process.join()
+
+        with pytest.raises(server_module.ServiceError) as e:
+            service.handle("/generate", ddl)
+        assert e.value.status == 503
+        assert service.handle("/generate", ddl)[0]
+        assert service.pool_restarts == 1
+    finally:
+        service.shutdown()
+
+
+def test_slow_generation_times_out_and_frees_its_slot():
+    service = server_module.GenerationService(workers=1, max_concurrent=1, cache_size=0, job_timeout=0.001)
+    try:
+        ddl = b'{"ddl": "CREATE TABLE t (a INT, created_at TIMESTAMP);"}'
+        with pytest.raises(server_module.ServiceError) as e:
+            service.handle("/generate", ddl)
+        assert e.value.status == 504
+
+        service.job_timeout = 30
+        assert service.handle("/generate", ddl)[0]
+    finally:
+        service.shutdown()
@@ -0,0 +1,89 @@
+import sqlite3
+
+from silvervector.dialects import get_dialect
+from silvervector.generator import DashboardGenerator
+from silvervector.parser import SilverVectorParser
+from silvervector.shards import shard_period
+
+SEPTEMBER_2026 = 1788220800
+OCTOBER_2026 = 1790812800
+
+
+def shard_ddl(*suffixes, columns="log_id INTEGER PRIMARY KEY, latency_ms INT, log_level VARCHAR(10), log_time TIMESTAMP"):
+    return "\n".join(f"CREATE TABLE SystemLogs_{suffix} ({columns});" for suffix in suffixes)
+
+
+def panel_sql(dashboard, title):
+    return next(p for p in dashboard["panels"] if p["title"] == title)["targets"][0]["rawSql"]
+
+
+def test_shard_period_suffixes():
+    assert shard_period("SystemLogs_2026_09") == ("SystemLogs", "month", SEPTEMBER_2026, OCTOBER_2026)
+    assert shard_period("measurement_y2026m09")[:2] == ("measurement", "month")
+    assert shard_period("logs_20261231")[1:] == ("day", 1798675200, 1798761600)
+    assert shard_period("logs_2026_12")[3] == 1798761600  # December rolls into next year
+    assert shard_period("audit_2025")[1] == "year"
+    assert shard_period("logs_2026_02_30") is None
+    assert shard_period("SystemLogs") is None
+
+
+def test_families_collapse_into_one_logical_table():
+    ddl = shard_ddl("2026_10", "2026_08", "2026_09") + "\nCREATE TABLE Orders (id INT, total INT, created_at TIMESTAMP);"
+    tables = SilverVectorParser(ddl).parse()
+
+    assert tables.table_names == ["SystemLogs", "Orders"]
+    logs = tables.table("SystemLogs")
+    assert [s.name for s in logs.shards] == ["SystemLogs_2026_08", "SystemLogs_2026_09", "SystemLogs_2026_10"]
+    assert logs.time_col.name == "log_time"
+    assert tables.to_dict()["tables"][0]["shards"][0] == "SystemLogs_2026_08"
+    assert len(SilverVectorParser(ddl, collapse_shards=False).parse()) == 4
+
+
+def test_lone_shards_drifted_schemas_and_existing_bases_are_left_alone():
+    lone = SilverVectorParser(shard_ddl("2026_09")).parse()
+    assert lone.table_names == ["SystemLogs_2026_09"]
+
+    drifted = shard_ddl("2026_08") + "\n" + shard_ddl("2026_09", columns="log_id INT, message TEXT, log_time TIMESTAMP")
+    assert len(SilverVectorParser(drifted).parse()) == 2
+
+    with_base = shard_ddl("2026_08", "2026_09") + "\nCREATE TABLE SystemLogs (log_id INT, log_time TIMESTAMP);"
+    assert len(SilverVectorParser(with_base).parse()) == 3
+
+
+def test_ranged_queries_only_read_overlapping_shards():
+    ddl = shard_ddl("2026_08", "2026_09")
+    dashboard = DashboardGenerator(SilverVectorParser(ddl).parse()).generate()
+    titles = [p["title"] for p in dashboard["panels"]]
+    assert titles.count("SystemLogs - latency_ms Trend") == 1
+    assert not any("2026" in title for title in titles)
+
+    trend = panel_sql(dashboard, "SystemLogs - latency_ms Trend")
+    assert trend.count("UNION ALL") == 1
+    assert f"$__to/1000 >= {SEPTEMBER_2026} AND $__from/1000 < {OCTOBER_2026}" in trend
+    # All-time queries still cover every shard
+    assert "WHERE $__to" not in panel_sql(dashboard, "SystemLogs - Total Records")
+
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(ddl)
+    conn.executemany("INSERT INTO SystemLogs_2026_08 (latency_ms, log_time) VALUES (1, '2026-08-10 00:00:00')",
+                     [()] * 50000)
+    conn.execute("INSERT INTO SystemLogs_2026_09 (latency_ms, log_time) VALUES (5, '2026-09-10 00:00:00')")
+    steps = []
+    conn.set_progress_handler(lambda: steps.append(1), 1000)
+    sql = trend.replace("$__from", str((SEPTEMBER_2026 + 86400) * 1000)).replace("$__to", str(OCTOBER_2026 * 1000))
+    assert conn.execute(sql).fetchall() == [(SEPTEMBER_2026 + 9 * 86400, 5)]
+    # The August shard (50k rows) was never scanned
+    assert len(steps) < 5
+
+
+def test_shard_guards_and_estimates_per_dialect():
+    tables = SilverVectorParser(shard_ddl("2026_08", "2026_09")).parse()
+    dashboard = DashboardGenerator(tables, dialect="postgres", row_counts="estimate").generate()
+
+    trend = panel_sql(dashboard, "SystemLogs - latency_ms Trend")
+    assert f"$__unixEpochTo() >= {SEPTEMBER_2026} AND $__unixEpochFrom() < {OCTOBER_2026}" in trend
+    assert trend.endswith(') AS SystemLogs WHERE $__timeFilter(log_time) GROUP BY 1 ORDER BY 1')
+    estimate = panel_sql(dashboard, "SystemLogs - Total Records (estimated)")
+    assert estimate.startswith("SELECT SUM(value) as value FROM (")
+    assert "'SystemLogs_2026_09'::regclass" in estimate
+    assert get_dialect("mysql").shard_guard(0, 10) == "$__unixEpochTo() >= 0 AND $__unixEpochFrom() < 10"
@@ -0,0 +1,25 @@
+import json
+
+from silvervector.generator import DashboardGenerator
+from silvervector.parser import SilverVectorParser
+from silvervector.tracing import Tracer
+
+
+def test_pipeline_records_stage_and_per_table_spans(tmp_path, ecommerce_ddl):
+    tracer = Tracer()
+    tables = SilverVectorParser(ecommerce_ddl, tracer=tracer).parse()
+    DashboardGenerator(tables, tracer=tracer).generate()
+
+    names = [e["name"] for e in tracer.events]
+    assert "fast path" in names
+    assert "classify OnlineTransactions" in names
+    assert "panels SystemLogs" in names
+    assert list(tracer.summary()) == ["parse", "classify", "template", "packs", "panels", "policy"]
+    assert "parse" in tracer.format_summary()
+
+    trace_path = tmp_path / "trace.json"
+    tracer.export(trace_path)
+    trace = json.loads(trace_path.read_text())
+    spans = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    assert len(spans) == len(tracer.events)
+    assert all(e["dur"] >= 0 and "ts" in e and "tid" in e for e in spans)